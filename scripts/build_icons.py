@@ -9,7 +9,9 @@ Usage:
     python scripts/build_icons.py
 """
 
+import io
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -21,43 +23,76 @@ except ImportError as e:
     exit(1)
 
 
-def svg_to_png(svg_path, png_path, size):
-    """Convert SVG to PNG at specified size."""
+def render_svg_png(svg_bytes, size):
+    """Render SVG (already read into bytes) to an in-memory PNG at specified size.
+
+    Returns a BytesIO positioned at the start.
+    """
+    bio = io.BytesIO()
+    cairosvg.svg2png(
+        bytestring=svg_bytes,
+        write_to=bio,
+        output_width=size,
+        output_height=size
+    )
+    bio.seek(0)
+    return bio
+
+
+def write_svg_png(svg_bytes, png_path, size):
+    """Convert SVG (already read into bytes) to a PNG file at specified size."""
     cairosvg.svg2png(
-        url=str(svg_path),
+        bytestring=svg_bytes,
         write_to=str(png_path),
         output_width=size,
         output_height=size
     )
-    print(f"  ✓ Created {png_path.name} ({size}x{size})")
+
+
+def _render_task(task):
+    """Worker entry point: task is (svg_bytes, png_path, size)."""
+    svg_bytes, png_path, size = task
+    write_svg_png(svg_bytes, png_path, size)
+    return png_path, size
+
+
+def render_pngs(tasks):
+    """Render (svg_path, png_path, size) tasks in parallel across CPU cores."""
+    # Read each SVG once; workers get the bytes instead of re-opening the file
+    svg_cache = {}
+    jobs = []
+    for svg_path, png_path, size in tasks:
+        if svg_path not in svg_cache:
+            svg_cache[svg_path] = Path(svg_path).read_bytes()
+        jobs.append((svg_cache[svg_path], png_path, size))
+
+    with ProcessPoolExecutor() as executor:
+        for png_path, size in executor.map(_render_task, jobs):
+            print(f"  ✓ Created {png_path.name} ({size}x{size})")
 
 
 def create_ico_from_svg(svg_path, ico_path, sizes=[16, 24, 32, 48, 256]):
     """Create multi-resolution ICO file from SVG."""
-    # Create temp PNGs at different sizes
-    temp_pngs = []
-    temp_dir = ico_path.parent / "temp"
-    temp_dir.mkdir(exist_ok=True)
-
-    for size in sizes:
-        temp_png = temp_dir / f"temp_{size}.png"
-        svg_to_png(svg_path, temp_png, size)
-        temp_pngs.append(Image.open(temp_png))
-
-    # Save as ICO with multiple resolutions
-    temp_pngs[0].save(
-        ico_path,
-        format='ICO',
-        sizes=[(img.width, img.height) for img in temp_pngs],
-        append_images=temp_pngs[1:]
-    )
+    # Rasterize once (in memory) at the largest size; smaller sizes are downscaled
+    largest = max(sizes)
+    png = render_svg_png(Path(svg_path).read_bytes(), largest)
+    with Image.open(png) as base:
+        base.load()
+        smaller = [
+            base.resize((size, size), Image.LANCZOS)
+            for size in sizes if size != largest
+        ]
+
+        # Save as ICO with multiple resolutions. The largest image must be the
+        # base: Pillow skips ICO sizes bigger than the image it saves from.
+        base.save(
+            ico_path,
+            format='ICO',
+            sizes=[(size, size) for size in sizes],
+            append_images=smaller
+        )
     print(f"  ✓ Created {ico_path.name} with sizes: {sizes}")
 
-    # Cleanup temp files
-    for temp_png in temp_dir.glob("temp_*.png"):
-        temp_png.unlink()
-    temp_dir.rmdir()
-
 
 def main():
     # Setup paths
@@ -85,12 +120,11 @@ def main():
         "icon_paused.svg"
     ]
 
-    for icon_name in tray_icons:
-        svg_path = svg_dir / icon_name
-        png_path = svg_dir / icon_name.replace('.svg', '.png')
-
-        # Create at 256x256 (high quality for system scaling)
-        svg_to_png(svg_path, png_path, 256)
+    # Create at 256x256 (high quality for system scaling)
+    render_pngs([
+        (svg_dir / icon_name, svg_dir / icon_name.replace('.svg', '.png'), 256)
+        for icon_name in tray_icons
+    ])
 
     print("\n" + "=" * 50)
     print("✓ All icons built successfully!")
@@ -82,6 +82,18 @@ def get_log_file_path(filename: str = 'telemetry_logger.log') -> Path:
     return get_app_data_dir() / filename
 
 
+def get_trackmap_cache_dir() -> Path:
+    """Get directory for the persistent track map cache
+
+    The directory itself is created by LMURestAPI when a track map is first
+    cached.
+
+    Returns:
+        Path to track map cache directory in app data directory
+    """
+    return get_app_data_dir() / 'trackmap_cache'
+
+
 def get_legacy_config_path() -> Optional[Path]:
     """Get legacy config file path (for migration)
 
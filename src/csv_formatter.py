@@ -8,6 +8,14 @@ from typing import Any, Dict, Iterable, List, Mapping
 
 from src.mvp_format import MVP_TELEMETRY_HEADER
 
+# Per-column cell kinds used by CSVFormatter's row plan
+_CELL_TEXT = 0
+_CELL_INT = 1
+_CELL_DECIMAL = 2
+
+# Quantize targets for _format_decimal, built once instead of per cell
+_QUANTIZE_TARGETS: Dict[int, Decimal] = {}
+
 
 class CSVFormatter:
     """Render normalized telemetry samples into the MVP CSV layout."""
@@ -27,6 +35,9 @@ class CSVFormatter:
             "Z [m]",
         }
 
+        # Per-column (kind, decimals) plan so rows don't re-check column sets
+        self._row_plan = tuple(self._cell_format(column) for column in self.header)
+
         # Required metadata order for the preamble
         self.metadata_order = [
             "Format",
@@ -84,40 +95,47 @@ class CSVFormatter:
 
         return "\n".join(lines) + "\n"
 
+    def _cell_format(self, column: str) -> tuple:
+        """Return the (kind, decimals) used to format cells of a column."""
+        if column in self._int_columns:
+            return (_CELL_INT, 0)
+        if column in self._three_decimal_columns:
+            return (_CELL_DECIMAL, 3)
+        if column in self._two_decimal_columns:
+            return (_CELL_DECIMAL, 2)
+        return (_CELL_TEXT, 0)
+
     def _format_sample_row(self, sample: Mapping[str, Any]) -> str:
         values = []
-        for column in self.header:
+        append = values.append
+        format_decimal = self._format_decimal
+        for column, (kind, decimals) in zip(self.header, self._row_plan):
             value = sample.get(column)
             if value is None or value == "":
-                values.append("")
-                continue
-
-            if column in self._int_columns:
+                append("")
+            elif kind == _CELL_DECIMAL:
+                append(format_decimal(value, decimals))
+            elif kind == _CELL_INT:
                 try:
-                    values.append(str(int(round(float(value)))))
+                    append(str(int(round(float(value)))))
                 except (TypeError, ValueError):
-                    values.append("0")
-                continue
-
-            if column in self._three_decimal_columns:
-                values.append(self._format_decimal(value, 3))
-                continue
-
-            if column in self._two_decimal_columns:
-                values.append(self._format_decimal(value, 2))
-                continue
-
-            values.append(str(value))
+                    append("0")
+            else:
+                append(str(value))
 
         return ",".join(values)
 
     def _format_decimal(self, value: Any, decimals: int) -> str:
-        quantize_target = Decimal("1" if decimals == 0 else "1." + ("0" * decimals))
+        quantize_target = _QUANTIZE_TARGETS.get(decimals)
+        if quantize_target is None:
+            quantize_target = Decimal("1" if decimals == 0 else "1." + ("0" * decimals))
+            _QUANTIZE_TARGETS[decimals] = quantize_target
 
         try:
             numeric = Decimal(str(value))
         except (InvalidOperation, ValueError, TypeError):
             numeric = Decimal(0)
 
-        quantized = numeric.quantize(quantize_target, rounding=ROUND_HALF_UP)
-        return f"{quantized:.{decimals}f}"
+        # Quantized to a fixed negative exponent, str() gives the same
+        # plain fixed-point text as f"{quantized:.{decimals}f}"
+        return str(numeric.quantize(quantize_target, rounding=ROUND_HALF_UP))
@@ -1,9 +1,14 @@
 """File management for saving telemetry CSV files"""
 
 import os
+import queue
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional
+
+# Flags for lap file writes (O_BINARY only exists, and matters, on Windows)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
 
 
 class FileManager:
@@ -25,6 +30,8 @@ class FileManager:
             config: Configuration dictionary with optional keys:
                 - output_dir: Base directory for output files (default: "./telemetry_output")
                 - filename_format: Format string for filenames (default: "{session_id}_{track}_{car}_{driver}_lap{lap}_t{lap_time}s.csv")
+                - write_buffer_bytes: Block size for file writes (default: 1 MiB)
+                - write_queue_size: Max pending background writes (default: 8)
         """
         self.config = config or {}
         self.output_dir = Path(self.config.get('output_dir', './telemetry_output'))
@@ -32,9 +39,19 @@ class FileManager:
             'filename_format',
             '{session_id}_{track}_{car}_{driver}_lap{lap}_t{lap_time}s.csv'
         )
+        self.write_buffer_bytes = max(1, int(self.config.get('write_buffer_bytes', 1 << 20)))
+
+        # Background writer for save_lap_async (started on first use)
+        self._write_queue: queue.Queue = queue.Queue(
+            maxsize=max(1, int(self.config.get('write_queue_size', 8)))
+        )
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
 
         # Create output directory if it doesn't exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # String form for the save hot path (os.path.join is much cheaper than Path /)
+        self._output_dir_str = str(self.output_dir)
 
     def save_lap(
         self,
@@ -56,13 +73,115 @@ class FileManager:
             Path to saved file as string
         """
         filename = self._generate_filename(lap_summary, session_info, filename_format)
-        filepath = self.output_dir / filename
+        filepath = os.path.join(self._output_dir_str, filename)
+
+        self._write_bytes(filepath, csv_content.encode('utf-8'))
+
+        return filepath
+
+    def save_lap_async(
+        self,
+        csv_content: str,
+        lap_summary: Dict[str, Any],
+        session_info: Dict[str, Any],
+        filename_format: Optional[str] = None,
+        on_saved: Optional[Callable[[str], None]] = None,
+        on_error: Optional[Callable[[str, Exception], None]] = None
+    ) -> str:
+        """
+        Queue lap data to be saved by the background writer thread
+
+        Same arguments as save_lap(), but returns as soon as the content is
+        queued so the caller (usually the telemetry loop) is not blocked on
+        disk I/O. Blocks only if write_queue_size writes are already pending.
+        Call flush() before shutdown to make sure queued laps reach disk.
+
+        Args:
+            on_saved: Called with the file path once the file is written
+            on_error: Called with the file path and exception if the write
+                fails (default: print a warning)
+
+        Both callbacks run on the writer thread.
+
+        Returns:
+            Path the file will be saved to, as string
+        """
+        filename = self._generate_filename(lap_summary, session_info, filename_format)
+        filepath = os.path.join(self._output_dir_str, filename)
+
+        # Encode on the caller thread so the large string can be released early
+        data = csv_content.encode('utf-8')
 
-        # Write CSV content to file
-        with open(filepath, 'w') as f:
-            f.write(csv_content)
+        self._ensure_writer_thread()
+        self._write_queue.put((filepath, data, on_saved, on_error))
 
-        return str(filepath)
+        return filepath
+
+    def flush(self):
+        """Block until all queued background writes have been written"""
+        self._write_queue.join()
+
+    def _ensure_writer_thread(self):
+        """Start the background writer thread if it is not running"""
+        with self._writer_lock:
+            if self._writer_thread is None or not self._writer_thread.is_alive():
+                self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+                self._writer_thread.start()
+
+    def _writer_loop(self):
+        """Background thread: write queued items to disk and report the outcome"""
+        while True:
+            filepath, data, on_saved, on_error = self._write_queue.get()
+            try:
+                try:
+                    self._write_bytes(filepath, data)
+                except Exception as e:
+                    if on_error is None:
+                        raise
+                    on_error(filepath, e)
+                else:
+                    if on_saved is not None:
+                        on_saved(filepath)
+            except Exception as e:
+                # Unreported write error, or a failing callback - never kill the writer
+                print(f"[WARNING] Error writing lap file {filepath}: {e}")
+            finally:
+                self._write_queue.task_done()
+
+    def _write_bytes(self, filepath: str, data: bytes) -> None:
+        """
+        Write encoded CSV content to disk in large blocks
+
+        Writes go straight to a raw file descriptor in write_buffer_bytes
+        slices, so a multi-MB lap costs a handful of syscalls and no extra
+        copy through Python's file object layers. Where supported the full
+        size is preallocated first so the filesystem can lay it out
+        contiguously.
+
+        Args:
+            filepath: Destination file path
+            data: UTF-8 encoded CSV content
+        """
+        block_size = self.write_buffer_bytes
+        view = memoryview(data)
+
+        fd = os.open(filepath, _WRITE_FLAGS, 0o644)
+        try:
+            if data and hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(fd, 0, len(data))
+                except OSError:
+                    # Only a hint; not every filesystem supports it
+                    pass
+
+            for offset in range(0, len(view), block_size):
+                chunk = view[offset:offset + block_size]
+                # Writes may be short; keep going until the block is out
+                while chunk:
+                    written = os.write(fd, chunk)
+                    chunk = chunk[written:]
+        finally:
+            os.close(fd)
 
     def _generate_filename(
         self,
@@ -87,7 +206,10 @@ class FileManager:
             Filename string
         """
         lap = lap_summary.get('lap', 0)
-        session_id = session_info.get('session_id', self._generate_fallback_session_id())
+        if 'session_id' in session_info:
+            session_id = session_info['session_id']
+        else:
+            session_id = self._generate_fallback_session_id()
 
         # Get raw field values
         # Prefer car_model (e.g., "Cadillac V-Series.R") over car_name (team entry)
@@ -195,7 +317,12 @@ class FileManager:
 
     def _generate_fallback_session_id(self) -> str:
         """Generate a fallback session ID if none provided"""
-        return datetime.now().strftime("%Y%m%d%H%M%S")
+        now = datetime.now()
+        # Same as strftime("%Y%m%d%H%M%S"), without strftime's per-call overhead
+        return (
+            f"{now.year:04d}{now.month:02d}{now.day:02d}"
+            f"{now.hour:02d}{now.minute:02d}{now.second:02d}"
+        )
 
     def _resolve_timestamp(self, value: Optional[Any]) -> datetime:
         """Resolve a timestamp from session info for filename formatting."""
@@ -230,10 +357,25 @@ class FileManager:
         Returns:
             List of filenames
         """
-        if not self.output_dir.exists():
-            return []
+        return [entry.name for entry in self._iter_lap_files()]
+
+    def _iter_lap_files(self):
+        """
+        Iterate over CSV files in the output directory
+
+        Uses os.scandir so file type comes from the directory listing rather
+        than a stat() and Path object per entry.
 
-        return [f.name for f in self.output_dir.glob('*.csv')]
+        Yields:
+            os.DirEntry for each .csv file
+        """
+        try:
+            with os.scandir(self._output_dir_str) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.csv') and entry.is_file():
+                        yield entry
+        except FileNotFoundError:
+            return
 
     def delete_lap(self, filename: str) -> bool:
         """
@@ -260,13 +402,12 @@ class FileManager:
         Returns:
             Number of files deleted
         """
-        count = 0
+        # Collect first so the directory isn't modified while it is scanned
+        paths = [entry.path for entry in self._iter_lap_files()]
+        for path in paths:
+            os.unlink(path)
 
-        for filepath in self.output_dir.glob('*.csv'):
-            filepath.unlink()
-            count += 1
-
-        return count
+        return len(paths)
 
     def get_session_laps(self, filter_string: str) -> list[str]:
         """
@@ -281,8 +422,9 @@ class FileManager:
         Returns:
             List of filenames matching the filter
         """
-        if not self.output_dir.exists():
-            return []
-
-        pattern = f"*{filter_string}*.csv"
-        return [f.name for f in self.output_dir.glob(pattern)]
+        # Plain substring test: no glob pattern translation per call, and
+        # characters like '[' in the filter are matched literally.
+        return [
+            entry.name for entry in self._iter_lap_files()
+            if filter_string in entry.name
+        ]
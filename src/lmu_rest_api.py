@@ -13,10 +13,46 @@ fast lookups during telemetry processing.
 """
 
 import json
+import os
+import re
+import struct
+import sys
+import threading
+import time
+from array import array
+from http.client import HTTPConnection, HTTPSConnection, HTTPException
+from http.client import BadStatusLine
+from itertools import chain
 from typing import Dict, Any, Optional
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
-import socket
+from urllib.parse import urlsplit
+from urllib.error import HTTPError
+
+# orjson (optional) decodes the large vehicle and track map payloads several
+# times faster than json; both accept bytes and raise ValueError subclasses
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# How long an is_available() result is reused before probing again (seconds)
+AVAILABILITY_TTL = 2.0
+
+# How long a track map saved in the on-disk cache stays valid (seconds)
+TRACKMAP_DISK_CACHE_TTL = 24 * 60 * 60
+
+# Characters not allowed in on-disk track map cache filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9._-]+')
+
+# On-disk track map cache file layout: header (magic, track name length,
+# track point count, pit lane point count), UTF-8 track name, then x/z
+# coordinates as little-endian doubles
+_TRACKMAP_CACHE_SUFFIX = '.trackmap'
+_TRACKMAP_CACHE_MAGIC = b'LMUTMAP1'
+_TRACKMAP_CACHE_HEADER = struct.Struct('<8sHII')
+_DOUBLE_SIZE = array('d').itemsize
+
+# Known human-readable vehicle classes in the REST API 'classes' array
+_READABLE_CLASSES = frozenset({'Hypercar', 'LMP2', 'LMP3', 'GTE', 'GT3', 'LMGT3'})
 
 
 class LMURestAPI:
@@ -28,32 +64,138 @@ class LMURestAPI:
     information that is not available through shared memory alone.
     """
 
-    def __init__(self, base_url: str = "http://localhost:6397"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:6397",
+        trackmap_cache_dir: Optional[str] = None
+    ):
         """
         Initialize REST API client
 
         Args:
             base_url: Base URL for LMU REST API (default: http://localhost:6397)
+            trackmap_cache_dir: Directory for a persistent track map cache, so
+                track maps survive restarts (default: None - memory only)
         """
         self.base_url = base_url
         self.vehicle_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        # Maps every "<prefix>" where vehicle_cache has "<prefix> ..." to its metadata
+        self._vehicle_prefix_index: Dict[str, Dict[str, Any]] = {}
         self.trackmap_cache: Dict[str, Dict[str, Any]] = {}
+        self.trackmap_cache_dir = trackmap_cache_dir
+
+        # Persistent keep-alive connection (created lazily, one request at a time)
+        parts = urlsplit(base_url)
+        self._scheme = parts.scheme or 'http'
+        self._host = parts.hostname or 'localhost'
+        self._port = parts.port
+        self._path_prefix = parts.path.rstrip('/')
+        self._conn: Optional[HTTPConnection] = None
+        self._conn_lock = threading.Lock()
+
+        # Cached is_available() result and its expiry (time.monotonic())
+        self._available = False
+        self._available_until = 0.0
 
     def is_available(self) -> bool:
         """
         Check if LMU REST API is available
 
+        The result is cached for AVAILABILITY_TTL seconds so repeated checks
+        on the telemetry path don't probe the API every time.
+
         Returns:
             True if API is reachable, False otherwise
         """
+        now = time.monotonic()
+        if now < self._available_until:
+            return self._available
+
         try:
-            req = Request(f"{self.base_url}/rest/sessions")
-            with urlopen(req, timeout=1) as response:
-                return response.status == 200
-        except (URLError, HTTPError, socket.timeout, ConnectionRefusedError):
-            return False
+            self._http_get("/rest/sessions", timeout=1)
+            available = True
         except Exception:
-            return False
+            available = False
+
+        self._available = available
+        self._available_until = time.monotonic() + AVAILABILITY_TTL
+        return available
+
+    def _http_get(self, path: str, timeout: float) -> bytes:
+        """
+        GET a REST endpoint over the persistent connection
+
+        Reuses one keep-alive connection to the API instead of opening a new
+        TCP connection per request. If the server has closed the idle
+        connection, reconnects and retries once.
+
+        Args:
+            path: Endpoint path (e.g. "/rest/sessions")
+            timeout: Socket timeout in seconds
+
+        Returns:
+            Response body as bytes
+
+        Raises:
+            HTTPError: If the API responds with a non-200 status
+            OSError / HTTPException: If the API is unreachable
+        """
+        url_path = f"{self._path_prefix}{path}"
+
+        with self._conn_lock:
+            for attempt in range(2):
+                conn = self._get_connection(timeout)
+                try:
+                    conn.request('GET', url_path)
+                    response = conn.getresponse()
+                    body = response.read()
+                except (ConnectionError, BadStatusLine):
+                    # Stale keep-alive connection (reset, aborted or closed by the
+                    # server; RemoteDisconnected is both) - reconnect and retry once
+                    self._close_connection()
+                    if attempt:
+                        raise
+                    continue
+                except Exception:
+                    self._close_connection()
+                    raise
+
+                if response.will_close:
+                    self._close_connection()
+
+                if response.status != 200:
+                    raise HTTPError(
+                        f"{self.base_url}{path}", response.status, response.reason,
+                        response.headers, None
+                    )
+                return body
+
+        raise HTTPException(f"No response from {self.base_url}{path}")  # pragma: no cover
+
+    def _get_connection(self, timeout: float) -> HTTPConnection:
+        """Return the persistent connection, creating it if needed"""
+        if self._conn is None:
+            conn_class = HTTPSConnection if self._scheme == 'https' else HTTPConnection
+            self._conn = conn_class(self._host, self._port, timeout=timeout)
+        else:
+            self._conn.timeout = timeout
+            if self._conn.sock is not None:
+                self._conn.sock.settimeout(timeout)
+        return self._conn
+
+    def _close_connection(self):
+        """Close and drop the persistent connection"""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    def close(self):
+        """Close the persistent connection to the API"""
+        with self._conn_lock:
+            self._close_connection()
 
     def fetch_vehicle_data(self, force_refresh: bool = False) -> Dict[str, Dict[str, Any]]:
         """
@@ -85,9 +227,7 @@ class LMURestAPI:
 
         # Fetch from API
         try:
-            req = Request(f"{self.base_url}/rest/sessions/getAllVehicles")
-            with urlopen(req, timeout=2) as response:
-                data = json.loads(response.read().decode('utf-8'))
+            data = _json_loads(self._http_get("/rest/sessions/getAllVehicles", timeout=2))
 
             # Build lookup dictionary
             vehicle_lookup = {}
@@ -120,10 +260,11 @@ class LMURestAPI:
 
             # Cache the results
             self.vehicle_cache = vehicle_lookup
+            self._vehicle_prefix_index = self._build_prefix_index(vehicle_lookup)
             return vehicle_lookup
 
-        except (URLError, HTTPError, socket.timeout, ConnectionRefusedError):
-            # API not available - return empty dict
+        except (HTTPException, OSError):
+            # API not available (URLError/HTTPError/timeouts are OSErrors) - return empty dict
             return {}
         except Exception as e:
             # Unexpected error - log and return empty
@@ -173,11 +314,8 @@ class LMURestAPI:
         if not classes:
             return ''
 
-        # Known human-readable classes
-        readable_classes = ['Hypercar', 'LMP2', 'LMP3', 'GTE', 'GT3', 'LMGT3']
-
         for cls in classes:
-            if cls in readable_classes:
+            if cls in _READABLE_CLASSES:
                 return cls
 
         # Fallback: return second element if it exists and looks like a class
@@ -186,6 +324,31 @@ class LMURestAPI:
 
         return classes[0] if classes else ''
 
+    @staticmethod
+    def _build_prefix_index(
+        vehicle_lookup: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Index vehicles by every space-delimited prefix of their name
+
+        Lets lookup_vehicle() resolve shared memory names that lack the REST
+        API's version suffix with a dict lookup. When several vehicles share
+        a prefix the first one wins, matching the previous linear scan.
+
+        Args:
+            vehicle_lookup: Vehicle metadata keyed by full REST API name
+
+        Returns:
+            Vehicle metadata keyed by name prefix
+        """
+        prefix_index: Dict[str, Dict[str, Any]] = {}
+        for cached_name, metadata in vehicle_lookup.items():
+            end = cached_name.find(' ')
+            while end != -1:
+                prefix_index.setdefault(cached_name[:end], metadata)
+                end = cached_name.find(' ', end + 1)
+        return prefix_index
+
     def lookup_vehicle(self, vehicle_name: str) -> Optional[Dict[str, Any]]:
         """
         Look up vehicle metadata by name
@@ -210,20 +373,32 @@ class LMURestAPI:
         # If no exact match, try fuzzy matching (handle version suffix mismatch)
         # Shared memory: "Team Name #123:CODE"
         # REST API:      "Team Name #123:CODE 1.42"
-        for cached_name, metadata in self.vehicle_cache.items():
-            # Check if cached name starts with the vehicle name
-            # This handles the case where REST API has version suffixes
-            if cached_name.startswith(vehicle_name + ' '):
-                return metadata
+        return self._vehicle_prefix_index.get(vehicle_name)
+
+    def fetch_trackmap_waypoints(self) -> list:
+        """
+        Fetch the raw waypoint list from /rest/watch/trackmap
+
+        Uses the persistent connection, so repeated fetches (and tools such as
+        visualize_trackmap.py) don't pay for a new TCP connection each time.
+
+        Returns:
+            List of waypoint dicts with 'type', 'x', 'y' and 'z' fields
 
-        return None
+        Raises:
+            HTTPError: If the API responds with a non-200 status
+            OSError / HTTPException: If the API is unreachable
+            ValueError: If the response is not valid JSON
+        """
+        return _json_loads(self._http_get("/rest/watch/trackmap", timeout=2))
 
     def get_trackmap(self, track_name: str = "", force_refresh: bool = False) -> Dict[str, Any]:
         """
         Fetch track map waypoints from /rest/watch/trackmap
 
         Returns track outline (type 0) and pit lane (type 1) waypoints.
-        Results are cached by track name to avoid excessive API calls.
+        Results are cached by track name to avoid excessive API calls
+        (in memory, and on disk if trackmap_cache_dir is set).
 
         Args:
             track_name: Track name for caching (optional)
@@ -241,19 +416,30 @@ class LMURestAPI:
             Returns empty dict {} if API is unavailable or error occurs.
         """
         # Check cache first (if track_name provided)
-        if track_name and not force_refresh and track_name in self.trackmap_cache:
-            return self.trackmap_cache[track_name]
+        if track_name and not force_refresh:
+            if track_name in self.trackmap_cache:
+                return self.trackmap_cache[track_name]
+
+            result = self._load_cached_trackmap(track_name)
+            if result:
+                self.trackmap_cache[track_name] = result
+                return result
 
         # Fetch from API
         try:
-            req = Request(f"{self.base_url}/rest/watch/trackmap")
-            with urlopen(req, timeout=2) as response:
-                waypoints = json.loads(response.read().decode('utf-8'))
-
-            # Filter to track outline (type 0) and pit lane (type 1)
-            # Ignore pit bays (types 2+)
-            track_outline = [[w['x'], w['z']] for w in waypoints if w['type'] == 0]
-            pit_lane = [[w['x'], w['z']] for w in waypoints if w['type'] == 1]
+            waypoints = self.fetch_trackmap_waypoints()
+
+            # Split into track outline (type 0) and pit lane (type 1) in one pass
+            # Ignore pit bays (types 2+). Coordinates are always floats, as
+            # they are when loaded back from the on-disk cache
+            track_outline = []
+            pit_lane = []
+            for w in waypoints:
+                waypoint_type = w['type']
+                if waypoint_type == 0:
+                    track_outline.append([float(w['x']), float(w['z'])])
+                elif waypoint_type == 1:
+                    pit_lane.append([float(w['x']), float(w['z'])])
 
             result = {
                 'track': track_outline,
@@ -262,14 +448,16 @@ class LMURestAPI:
                 'source': 'LMU_REST_API'
             }
 
-            # Cache the result (if track_name provided)
-            if track_name:
+            # Cache the result (if track_name provided). An empty outline means
+            # the API had no map yet, so fetch again next time instead
+            if track_name and track_outline:
                 self.trackmap_cache[track_name] = result
+                self._save_cached_trackmap(track_name, result)
 
             return result
 
-        except (URLError, HTTPError, socket.timeout, ConnectionRefusedError):
-            # API not available - return empty dict
+        except (HTTPException, OSError):
+            # API not available (URLError/HTTPError/timeouts are OSErrors) - return empty dict
             return {}
         except (KeyError, ValueError, json.JSONDecodeError) as e:
             # Invalid response format - return empty dict
@@ -280,7 +468,107 @@ class LMURestAPI:
             print(f"[WARNING] Error fetching track map from REST API: {e}")
             return {}
 
+    def _trackmap_cache_path(self, track_name: str) -> Optional[str]:
+        """Return the on-disk cache file for a track, or None if disabled"""
+        if not self.trackmap_cache_dir:
+            return None
+        filename = _UNSAFE_FILENAME_CHARS.sub('_', track_name) + _TRACKMAP_CACHE_SUFFIX
+        return os.path.join(self.trackmap_cache_dir, filename)
+
+    def _load_cached_trackmap(self, track_name: str) -> Dict[str, Any]:
+        """
+        Load a track map from the on-disk cache
+
+        Returns:
+            Cached track map, or empty dict if missing, expired or unreadable
+        """
+        path = self._trackmap_cache_path(track_name)
+        if path is None:
+            return {}
+
+        try:
+            if time.time() - os.path.getmtime(path) > TRACKMAP_DISK_CACHE_TTL:
+                return {}
+            with open(path, 'rb') as f:
+                data = f.read()
+            magic, name_length, track_count, pit_count = _TRACKMAP_CACHE_HEADER.unpack_from(data)
+        except (OSError, struct.error):
+            return {}
+
+        offset = _TRACKMAP_CACHE_HEADER.size
+        name = data[offset:offset + name_length]
+        coords = data[offset + name_length:]
+
+        # Reject old/corrupt files and files written for a different track
+        # with the same safe filename
+        if (magic != _TRACKMAP_CACHE_MAGIC or name != track_name.encode('utf-8')
+                or len(coords) != (track_count + pit_count) * 2 * _DOUBLE_SIZE):
+            return {}
+
+        values = array('d')
+        values.frombytes(coords)
+        if sys.byteorder == 'big':
+            values.byteswap()
+
+        # Pair up the flat x, z, x, z, ... values again
+        flat = iter(values.tolist())
+        points = list(map(list, zip(flat, flat)))
+        return {
+            'track': points[:track_count],
+            'pit_lane': points[track_count:],
+            'waypoint_count': track_count + pit_count,
+            'source': 'LMU_REST_API'
+        }
+
+    def _save_cached_trackmap(self, track_name: str, trackmap: Dict[str, Any]):
+        """
+        Write a track map to the on-disk cache (best effort)
+
+        The file is a small header, the track name, then the track and pit lane
+        coordinates as flat little-endian doubles - smaller than JSON and
+        loaded without parsing.
+        """
+        path = self._trackmap_cache_path(track_name)
+        if path is None:
+            return
+
+        track = trackmap['track']
+        pit_lane = trackmap['pit_lane']
+        name = track_name.encode('utf-8')
+
+        values = array('d', chain.from_iterable(track))
+        values.extend(chain.from_iterable(pit_lane))
+        if sys.byteorder == 'big':
+            values.byteswap()
+
+        try:
+            os.makedirs(self.trackmap_cache_dir, exist_ok=True)
+            # Write to a temp file and rename so readers never see a partial file
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_TRACKMAP_CACHE_HEADER.pack(
+                    _TRACKMAP_CACHE_MAGIC, len(name), len(track), len(pit_lane)
+                ))
+                f.write(name)
+                f.write(values.tobytes())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARNING] Could not write track map cache {path}: {e}")
+
     def clear_cache(self):
-        """Clear cached vehicle and track map data"""
+        """Clear cached vehicle and track map data (including the on-disk cache)"""
         self.vehicle_cache = None
+        self._vehicle_prefix_index = {}
         self.trackmap_cache = {}
+
+        if self.trackmap_cache_dir:
+            try:
+                with os.scandir(self.trackmap_cache_dir) as entries:
+                    paths = [e.path for e in entries if e.name.endswith(_TRACKMAP_CACHE_SUFFIX)]
+            except OSError:
+                paths = []
+            for path in paths:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
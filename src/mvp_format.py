@@ -26,6 +26,8 @@ MVP_TELEMETRY_HEADER: List[str] = [
 class SampleNormalizer:
     """Normalises raw telemetry dictionaries into the MVP schema."""
 
+    __slots__ = ()
+
     _THREE_DEC_CHANNELS = {"LapDistance [m]"}
     _PERCENT_CHANNELS = {
         "ThrottlePercentage [%]",
@@ -35,40 +37,28 @@ class SampleNormalizer:
     def normalize(self, telemetry: Mapping[str, Any]) -> Dict[str, Any]:
         """Return a telemetry sample keyed by the canonical headers."""
 
-        lap_distance = self._to_float(
-            telemetry.get("LapDistance [m]"), telemetry.get("lap_distance"), default=0.0
-        )
+        # Bound locals: normalize() runs for every sample (and every opponent sample)
+        get = telemetry.get
+        to_float = self._to_float
+        percent_value = self._percent_value
+
+        lap_distance = to_float(get("LapDistance [m]"), get("lap_distance"), default=0.0)
 
         sample: Dict[str, Any] = {
             "LapDistance [m]": lap_distance,
             "Sector [int]": self._resolve_sector(telemetry, lap_distance),
-            "Speed [km/h]": self._to_float(
-                telemetry.get("Speed [km/h]"), telemetry.get("speed"), default=0.0
-            ),
-            "EngineRevs [rpm]": self._to_float(
-                telemetry.get("EngineRevs [rpm]"),
-                telemetry.get("engine_rpm"),
-                telemetry.get("rpm"),
-                default=0.0,
-            ),
-            "ThrottlePercentage [%]": self._percent_value(
-                telemetry.get("ThrottlePercentage [%]"), telemetry.get("throttle")
-            ),
-            "BrakePercentage [%]": self._percent_value(
-                telemetry.get("BrakePercentage [%]"), telemetry.get("brake")
-            ),
-            "Steer [%]": self._steering_value(
-                telemetry.get("Steer [%]"), telemetry.get("steering")
-            ),
-            "Gear [int]": self._to_int(
-                telemetry.get("Gear [int]"), telemetry.get("gear"), default=0
-            ),
-            "X [m]": self._optional_float(
-                telemetry.get("X [m]"), telemetry.get("position_x")
+            "Speed [km/h]": to_float(get("Speed [km/h]"), get("speed"), default=0.0),
+            "EngineRevs [rpm]": to_float(
+                get("EngineRevs [rpm]"), get("engine_rpm"), get("rpm"), default=0.0
             ),
-            "Z [m]": self._optional_float(
-                telemetry.get("Z [m]"), telemetry.get("position_z")
+            "ThrottlePercentage [%]": percent_value(
+                get("ThrottlePercentage [%]"), get("throttle")
             ),
+            "BrakePercentage [%]": percent_value(get("BrakePercentage [%]"), get("brake")),
+            "Steer [%]": self._steering_value(get("Steer [%]"), get("steering")),
+            "Gear [int]": self._to_int(get("Gear [int]"), get("gear"), default=0),
+            "X [m]": self._optional_float(get("X [m]"), get("position_x")),
+            "Z [m]": self._optional_float(get("Z [m]"), get("position_z")),
         }
 
         return sample
@@ -116,7 +106,10 @@ class SampleNormalizer:
             if -1.5 <= number <= 1.5:
                 number *= 100.0
 
-            return max(0.0, min(100.0, number))
+            # Clamp to 0..100 (same result as max(0.0, min(100.0, number)),
+            # without two builtin calls per channel per sample)
+            number = number if number < 100.0 else 100.0
+            return number if number > 0.0 else 0.0
 
         return 0.0
 
@@ -133,7 +126,8 @@ class SampleNormalizer:
             if -2.0 <= number <= 2.0:
                 number *= 100.0
 
-            return max(-100.0, min(100.0, number))
+            number = number if number < 100.0 else 100.0
+            return number if number > -100.0 else -100.0
 
         return 0.0
 
@@ -163,8 +157,11 @@ class SampleNormalizer:
             telemetry.get("TrackLen [m]"), telemetry.get("track_length"), default=0.0
         )
         if track_length > 0.0:
-            progress = max(0.0, min(0.9999, lap_distance / track_length))
-            return int(progress * 3)
+            # Clamp progress to [0, 0.9999] so the sector is always 0..2
+            # (NaN lands in the last sector, as with max(0.0, min(0.9999, ...)))
+            progress = lap_distance / track_length
+            progress = progress if progress < 0.9999 else 0.9999
+            return int(progress * 3) if progress > 0.0 else 0
 
         return 0
 
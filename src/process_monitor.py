@@ -1,10 +1,19 @@
 """Process monitoring for auto-detection of LMU"""
 
+import os
 import time
 import sys
 from pathlib import Path
 import psutil
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+# Linux truncates /proc/<pid>/comm to 15 characters
+_PROC_COMM_MAX_LEN = 15
+
+# wait_for_process() polling backoff (seconds)
+_INITIAL_POLL_DELAY = 0.1
+_MAX_POLL_DELAY = 5.0
+_POLL_BACKOFF_FACTOR = 1.5
 
 
 class ProcessMonitor:
@@ -39,6 +48,15 @@ class ProcessMonitor:
         if self._matches_current_process():
             return True
 
+        # Fast path: the process we found last time is still alive
+        if self._cached_process_alive():
+            return True
+
+        if sys.platform.startswith('linux'):
+            found = self._scan_proc_comm()
+            if found is not None:
+                return found or self._matches_current_process()
+
         try:
             for proc in psutil.process_iter(['name']):
                 try:
@@ -59,6 +77,74 @@ class ProcessMonitor:
         # process iteration may be limited).
         return self._matches_current_process()
 
+    def _cached_process_alive(self) -> bool:
+        """Check whether the previously detected process is still running."""
+        if self._process is None:
+            return False
+
+        try:
+            # is_running() also guards against PID reuse (compares create time)
+            if self._process.is_running():
+                return True
+        except (psutil.Error, PermissionError):
+            pass
+
+        self._process = None
+        return False
+
+    def _scan_proc_comm(self) -> Optional[bool]:
+        """
+        Linux fast path: match process names from /proc/<pid>/comm
+
+        Reads the short command name for each PID directly instead of building
+        psutil Process objects for every process on the system.
+
+        Returns:
+            True/False if the scan completed, None if /proc is not usable
+        """
+        target = self.target_process.lower()
+        # Names that hit the comm length limit may be truncated; check them
+        # with psutil only if nothing else matched.
+        truncated_pids: List[int] = []
+
+        try:
+            with os.scandir('/proc') as entries:
+                for entry in entries:
+                    if not entry.name.isdigit():
+                        continue
+                    try:
+                        with open(f'/proc/{entry.name}/comm', 'rb') as f:
+                            name = f.read().decode('utf-8', 'replace').strip().lower()
+                    except OSError:
+                        # Process exited or is not readable
+                        continue
+
+                    if target in name:
+                        if self._remember_process(int(entry.name)):
+                            return True
+                    elif len(name) >= _PROC_COMM_MAX_LEN:
+                        truncated_pids.append(int(entry.name))
+        except OSError:
+            return None
+
+        for pid in truncated_pids:
+            try:
+                proc_name = psutil.Process(pid).name()
+            except (psutil.Error, PermissionError):
+                continue
+            if proc_name and target in proc_name.lower() and self._remember_process(pid):
+                return True
+
+        return False
+
+    def _remember_process(self, pid: int) -> bool:
+        """Cache a psutil handle for a matched PID. Returns False if it is gone."""
+        try:
+            self._process = psutil.Process(pid)
+            return True
+        except (psutil.Error, PermissionError):
+            return False
+
     def _matches_current_process(self) -> bool:
         """Fallback when process iteration is not permitted."""
         target = self.target_process.lower()
@@ -86,16 +172,28 @@ class ProcessMonitor:
         Args:
             timeout: Maximum time to wait in seconds (None = wait forever)
 
+        Polls quickly at first (so a process that is about to start is found
+        promptly), then backs off exponentially up to _MAX_POLL_DELAY to keep
+        the cost of long waits low.
+
         Returns:
             True if process found, False if timeout
         """
         start = time.time()
+        delay = _INITIAL_POLL_DELAY
         while True:
             if self.is_running():
                 return True
-            if timeout and (time.time() - start) > timeout:
-                return False
-            time.sleep(1.0)
+
+            sleep_for = delay
+            if timeout:
+                remaining = timeout - (time.time() - start)
+                if remaining <= 0:
+                    return False
+                sleep_for = min(delay, remaining)
+
+            time.sleep(sleep_for)
+            delay = min(delay * _POLL_BACKOFF_FACTOR, _MAX_POLL_DELAY)
 
     def get_process_info(self) -> Optional[Dict[str, Any]]:
         """
@@ -96,6 +96,11 @@ class SessionManager:
         if not self._is_duplicate_sample(normalized):
             self.lap_samples.append(normalized)
 
+    @property
+    def sample_count(self) -> int:
+        """Number of samples buffered for the current lap"""
+        return len(self.lap_samples)
+
     def get_lap_data(self) -> List[Dict[str, Any]]:
         """
         Get all samples for current lap
@@ -105,6 +110,21 @@ class SessionManager:
         """
         return self.lap_samples.copy()
 
+    def take_lap_data(self) -> List[Dict[str, Any]]:
+        """
+        Take ownership of all samples for current lap and reset the buffer
+
+        Unlike get_lap_data() this does not copy the (potentially large)
+        sample list; the caller gets the buffer itself.
+
+        Returns:
+            List of telemetry samples
+        """
+        lap_data = self.lap_samples
+        self.lap_samples = []
+        self.last_lap_time = 0.0
+        return lap_data
+
     def clear_lap_buffer(self):
         """Clear lap buffer after write"""
         self.lap_samples.clear()
@@ -117,8 +137,12 @@ class SessionManager:
         Returns:
             Session ID string (timestamp-based)
         """
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
-        return timestamp
+        now = datetime.now()
+        # Same as strftime("%Y%m%d%H%M%S%f"), without strftime's per-call overhead
+        return (
+            f"{now.year:04d}{now.month:02d}{now.day:02d}"
+            f"{now.hour:02d}{now.minute:02d}{now.second:02d}{now.microsecond:06d}"
+        )
 
     def get_lap_summary(self) -> Dict[str, Any]:
         """
@@ -6,6 +6,18 @@ from datetime import datetime
 from typing import Dict, Any
 from .telemetry_interface import TelemetryReaderInterface
 
+# How often read() refreshes its 'date' field (seconds)
+_DATE_REFRESH_INTERVAL = 1.0
+
+# Per-wheel values (RL, RR, FL, FR) that the mock never changes. Every read()
+# result references these same dicts, so treat them as read-only.
+_TYRE_TEMP = {'rl': 70.78, 'rr': 68.89, 'fl': 75.57, 'fr': 66.94}
+_TYRE_PRESSURE = {'rl': 23.95, 'rr': 23.63, 'fl': 24.20, 'fr': 23.32}
+_TYRE_WEAR = {'rl': 14.35, 'rr': 13.10, 'fl': 15.83, 'fr': 11.88}
+_BRAKE_TEMP = {'rl': 611.19, 'rr': 611.50, 'fl': 474.79, 'fr': 475.18}
+_SUSPENSION_POSITION = {'rl': 0.018, 'rr': 0.017, 'fl': 0.009, 'fr': 0.009}
+_SUSPENSION_VELOCITY = {'rl': -16.43, 'rr': -8.83, 'fl': -1.06, 'fr': 25.71}
+
 
 class MockTelemetryReader(TelemetryReaderInterface):
     """
@@ -30,6 +42,13 @@ class MockTelemetryReader(TelemetryReaderInterface):
         self.player_name = "Dev User"
         self.car_name = "Toyota GR010"
 
+        # Constant part of every read() result
+        self._template = self._build_template()
+
+        # Wall-clock date for read() results, refreshed at most once a second
+        self._date = datetime.now()
+        self._date_refreshed = self.start_time
+
     def is_available(self) -> bool:
         """Mock is always available"""
         return True
@@ -62,17 +81,17 @@ class MockTelemetryReader(TelemetryReaderInterface):
         total_elapsed = now - self.start_time
 
         # Simulate car progressing around track (~70m/s average speed)
-        raw_distance = elapsed * 70
-        lap_distance = raw_distance % self.track_length
         total_distance = 91576.37 + (total_elapsed * 70)
 
-        # Check for lap completion (when we've completed a full lap)
-        if raw_distance >= self.track_length and elapsed > 0.5:
-            self.lap += 1
-            self.lap_start_time = time.perf_counter()
-            elapsed = 0
-            raw_distance = 0
-            lap_distance = 0
+        # Lap completion: advance by however many whole laps have elapsed and
+        # keep the remainder, so lap timing doesn't drift with the read rate
+        lap_period = self.track_length / 70
+        laps_completed = int(elapsed // lap_period)
+        if laps_completed:
+            self.lap += laps_completed
+            self.lap_start_time += laps_completed * lap_period
+            elapsed = max(0.0, now - self.lap_start_time)
+        lap_distance = elapsed * 70
 
         # Simulate speed variation (slower in corners, faster on straights)
         # Use sine wave based on position around track
@@ -94,29 +113,80 @@ class MockTelemetryReader(TelemetryReaderInterface):
         position_x = -269.26 + (1000 * math.cos(angle))
         position_z = -218.97 + (1000 * math.sin(angle))
 
-        # Return complete telemetry dictionary
+        # Shared by steering and lateral G
+        steering_wave = math.sin(elapsed)
+
+        # Start from the constant fields and fill in the ones that change
+        data = self._template.copy()
+
+        # Player/Session Info
+        data['player_name'] = self.player_name
+        data['track_name'] = self.track_name
+        data['car_name'] = self.car_name
+        data['date'] = self._current_date(now)
+
+        # Lap Info
+        data['lap'] = self.lap
+        data['lap_distance'] = lap_distance
+        data['total_distance'] = total_distance
+        data['lap_time'] = elapsed
+        data['sector_index'] = sector_index
+        data['sector1_time'] = 0.0 if sector_index < 1 else 33.966
+        data['sector2_time'] = 0.0 if sector_index < 2 else 51.070
+
+        # Track Info
+        data['track_length'] = self.track_length
+
+        # Car State
+        data['speed'] = speed
+        data['rpm'] = rpm
+        data['throttle'] = throttle
+        data['brake'] = brake
+        data['steering'] = steering_wave * 35.0  # Percent steering input
+
+        # Position
+        data['position_x'] = position_x
+        data['position_z'] = position_z
+        data['yaw'] = angle
+
+        # Physics
+        data['g_force_lateral'] = -0.065 + (steering_wave * 0.1)
+        data['g_force_longitudinal'] = 0.340 + (speed_variation * 0.01)
+
+        # Wheels (RL, RR, FL, FR)
+        data['wheel_speed'] = {
+            'rl': speed + 0.2,
+            'rr': speed - 0.2,
+            'fl': speed + 0.3,
+            'fr': speed - 0.1
+        }
+        return data
+
+    def _current_date(self, now: float) -> datetime:
+        """Return the cached wall-clock date, refreshing it once per second"""
+        if now - self._date_refreshed >= _DATE_REFRESH_INTERVAL:
+            self._date = datetime.now()
+            self._date_refreshed = now
+        return self._date
+
+    @staticmethod
+    def _build_template() -> Dict[str, Any]:
+        """
+        Build the telemetry fields that never change between reads
+
+        read() copies this and overwrites the dynamic fields, instead of
+        building the full ~70-key dictionary from scratch on every call.
+        """
         return {
             # Player/Session Info
-            'player_name': self.player_name,
-            'track_name': self.track_name,
-            'car_name': self.car_name,
             'session_type': 'Practice',
             'game_version': '0.9',
-            'date': datetime.now(),
 
             # Lap Info
-            'lap': self.lap,
-            'lap_distance': lap_distance,
-            'total_distance': total_distance,
-            'lap_time': elapsed,
-            'sector_index': sector_index,
-            'sector1_time': 0.0 if sector_index < 1 else 33.966,
-            'sector2_time': 0.0 if sector_index < 2 else 51.070,
             'sector3_time': 0.0,
 
             # Track Info
             'track_id': 3,
-            'track_length': self.track_length,
             'track_temp': 41.80,
             'ambient_temp': 24.02,
             'weather': 'Clear',
@@ -124,71 +194,25 @@ class MockTelemetryReader(TelemetryReaderInterface):
             'wind_direction': 0.0,
 
             # Car State
-            'speed': speed,
-            'rpm': rpm,
             'gear': 6,
-            'throttle': throttle,
-            'brake': brake,
-            'steering': math.sin(elapsed) * 35.0,  # Percent steering input
             'clutch': 0.0,
             'drs': 0,
 
             # Position
-            'position_x': position_x,
             'position_y': 7.30,
-            'position_z': position_z,
-            'yaw': angle,
             'pitch': -0.002,
             'roll': 0.026,
 
             # Physics
-            'g_force_lateral': -0.065 + (math.sin(elapsed) * 0.1),
-            'g_force_longitudinal': 0.340 + (speed_variation * 0.01),
             'g_force_vertical': 0.092,
 
             # Wheels (RL, RR, FL, FR)
-            'wheel_speed': {
-                'rl': speed + 0.2,
-                'rr': speed - 0.2,
-                'fl': speed + 0.3,
-                'fr': speed - 0.1
-            },
-            'tyre_temp': {
-                'rl': 70.78,
-                'rr': 68.89,
-                'fl': 75.57,
-                'fr': 66.94
-            },
-            'tyre_pressure': {
-                'rl': 23.95,
-                'rr': 23.63,
-                'fl': 24.20,
-                'fr': 23.32
-            },
-            'tyre_wear': {
-                'rl': 14.35,
-                'rr': 13.10,
-                'fl': 15.83,
-                'fr': 11.88
-            },
-            'brake_temp': {
-                'rl': 611.19,
-                'rr': 611.50,
-                'fl': 474.79,
-                'fr': 475.18
-            },
-            'suspension_position': {
-                'rl': 0.018,
-                'rr': 0.017,
-                'fl': 0.009,
-                'fr': 0.009
-            },
-            'suspension_velocity': {
-                'rl': -16.43,
-                'rr': -8.83,
-                'fl': -1.06,
-                'fr': 25.71
-            },
+            'tyre_temp': _TYRE_TEMP,
+            'tyre_pressure': _TYRE_PRESSURE,
+            'tyre_wear': _TYRE_WEAR,
+            'brake_temp': _BRAKE_TEMP,
+            'suspension_position': _SUSPENSION_POSITION,
+            'suspension_velocity': _SUSPENSION_VELOCITY,
 
             # Hybrid/ERS (for LMH cars)
             'ers_level': 453702.47,
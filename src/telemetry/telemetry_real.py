@@ -6,6 +6,7 @@ from .telemetry_interface import TelemetryReaderInterface
 
 # Import REST API client for vehicle metadata
 try:
+    from ..app_paths import get_trackmap_cache_dir
     from ..lmu_rest_api import LMURestAPI
     REST_API_AVAILABLE = True
 except ImportError:
@@ -57,7 +58,8 @@ class RealTelemetryReader(TelemetryReaderInterface):
         self._rest_api_checked = False  # Track if we've attempted to fetch data
         if REST_API_AVAILABLE and LMURestAPI:
             try:
-                self.rest_api = LMURestAPI()
+                # Track maps never change for a track, so keep them across restarts
+                self.rest_api = LMURestAPI(trackmap_cache_dir=str(get_trackmap_cache_dir()))
                 print("[LMU REST API] Client initialized (data will be fetched when needed)")
             except Exception as e:
                 print(f"[LMU REST API] Error initializing: {e}")
@@ -116,7 +116,7 @@ class TelemetryLoop:
             'process_detected': False,
             'telemetry_available': False,
             'lap': self.session_manager.current_lap,
-            'samples_buffered': len(self.session_manager.lap_samples),
+            'samples_buffered': self.session_manager.sample_count,
             'lap_completed': False,
             'session_stopped': False,
             'stop_reason': None,
@@ -203,7 +203,7 @@ class TelemetryLoop:
                 else:
                     status['state'] = self.session_manager.state
                     status['lap'] = self.session_manager.current_lap
-                    status['samples_buffered'] = len(self.session_manager.lap_samples)
+                    status['samples_buffered'] = self.session_manager.sample_count
                     return status
 
             if self.session_manager.state == SessionState.DETECTED:
@@ -220,7 +220,7 @@ class TelemetryLoop:
             # Update status
             status['state'] = self.session_manager.state
             status['lap'] = self.session_manager.current_lap
-            status['samples_buffered'] = len(self.session_manager.lap_samples)
+            status['samples_buffered'] = self.session_manager.sample_count
 
         except Exception as e:
             self.session_manager.state = SessionState.ERROR
@@ -252,11 +252,11 @@ class TelemetryLoop:
 
         Returns True if lap data was emitted.
         """
-        lap_data = self.session_manager.get_lap_data()
-        if not lap_data:
+        if not self.session_manager.lap_samples:
             self.session_manager.clear_lap_buffer()
             return False
 
+        # Summary reads the buffer, so build it before taking the samples
         lap_summary = self.session_manager.get_lap_summary().copy()
         if reason:
             lap_summary['stop_reason'] = reason
@@ -264,10 +264,10 @@ class TelemetryLoop:
         else:
             lap_summary['lap_completed'] = True
 
+        lap_data = self.session_manager.take_lap_data()
         if self.on_lap_complete:
             self.on_lap_complete(lap_data, lap_summary)
 
-        self.session_manager.clear_lap_buffer()
         return True
 
     def _sample_indicates_active(self, telemetry: Dict[str, Any]) -> bool:
@@ -164,7 +164,7 @@ class TrayUI:
             return '1Lap - Detected (LMU running)'
         elif self.state == SessionState.LOGGING:
             lap = self.app.telemetry_loop.session_manager.current_lap
-            samples = len(self.app.telemetry_loop.session_manager.lap_samples)
+            samples = self.app.telemetry_loop.session_manager.sample_count
             return f'1Lap - Logging Lap {lap} ({samples} samples)'
         elif self.state == SessionState.PAUSED:
             return '1Lap - Paused'
@@ -11,11 +11,30 @@ Usage:
 
 import json
 import sys
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+from http.client import HTTPException
+from urllib.error import HTTPError
+
+from src.lmu_rest_api import LMURestAPI
 
 
 BASE_URL = "http://localhost:6397"
+api = LMURestAPI(BASE_URL)
+
+
+def value_range(waypoints, field):
+    """Return (min, max) of a numeric waypoint field in one pass, or None"""
+    lo = hi = None
+    for w in waypoints:
+        value = w.get(field)
+        if not isinstance(value, (int, float)):
+            continue
+        if lo is None:
+            lo = hi = value
+        elif value < lo:
+            lo = value
+        elif value > hi:
+            hi = value
+    return (lo, hi) if lo is not None else None
 
 
 def test_trackmap_endpoint():
@@ -28,66 +47,64 @@ def test_trackmap_endpoint():
     print(f"\nURL: {url}\n")
 
     try:
-        req = Request(url)
-        with urlopen(req, timeout=2) as response:
-            if response.status == 200:
-                data = json.loads(response.read().decode('utf-8'))
-
-                print(f"Status: {response.status} OK")
-                print(f"Response type: {type(data).__name__}")
-                print(f"Number of waypoints: {len(data) if isinstance(data, list) else 'N/A'}")
-                print("\n" + "=" * 80)
-                print("Full response (first 3 waypoints):")
-                print("=" * 80)
-
-                if isinstance(data, list) and len(data) > 0:
-                    # Show first 3 waypoints
-                    for i, waypoint in enumerate(data[:3]):
-                        print(f"\nWaypoint {i}:")
-                        print(json.dumps(waypoint, indent=2))
-
-                    if len(data) > 3:
-                        print(f"\n... and {len(data) - 3} more waypoints")
-
-                    # Analyze structure
-                    print("\n" + "=" * 80)
-                    print("Analysis:")
-                    print("=" * 80)
-
-                    if data:
-                        first = data[0]
-                        print(f"\nWaypoint fields: {list(first.keys())}")
-
-                        # Check if we have coordinate fields
-                        coord_fields = [k for k in first.keys() if any(
-                            c in k.lower() for c in ['x', 'y', 'z', 'pos', 'coord', 'lat', 'lon']
-                        )]
-                        if coord_fields:
-                            print(f"Coordinate-like fields: {coord_fields}")
-
-                        # Statistics
-                        print(f"\nTotal waypoints: {len(data)}")
-                        if coord_fields and len(coord_fields) >= 2:
-                            # Try to estimate track bounds
-                            x_field = coord_fields[0]
-                            z_field = coord_fields[1] if len(coord_fields) > 1 else coord_fields[0]
-
-                            x_values = [w.get(x_field, 0) for w in data if isinstance(w.get(x_field), (int, float))]
-                            z_values = [w.get(z_field, 0) for w in data if isinstance(w.get(z_field), (int, float))]
-
-                            if x_values and z_values:
-                                print(f"{x_field} range: {min(x_values):.2f} to {max(x_values):.2f}")
-                                print(f"{z_field} range: {min(z_values):.2f} to {max(z_values):.2f}")
-                else:
-                    print(json.dumps(data, indent=2))
-
-                return data
-            else:
-                print(f"Status: {response.status}")
-                print("Unexpected response code")
-                return None
-
-    except (URLError, HTTPError) as e:
+        data = api.fetch_trackmap_waypoints()
+
+        print("Status: 200 OK")
+        print(f"Response type: {type(data).__name__}")
+        print(f"Number of waypoints: {len(data) if isinstance(data, list) else 'N/A'}")
+        print("\n" + "=" * 80)
+        print("Full response (first 3 waypoints):")
+        print("=" * 80)
+
+        if isinstance(data, list) and len(data) > 0:
+            # Show first 3 waypoints
+            for i, waypoint in enumerate(data[:3]):
+                print(f"\nWaypoint {i}:")
+                print(json.dumps(waypoint, indent=2))
+
+            if len(data) > 3:
+                print(f"\n... and {len(data) - 3} more waypoints")
+
+            # Analyze structure
+            print("\n" + "=" * 80)
+            print("Analysis:")
+            print("=" * 80)
+
+            if data:
+                first = data[0]
+                print(f"\nWaypoint fields: {list(first.keys())}")
+
+                # Check if we have coordinate fields
+                coord_fields = [k for k in first.keys() if any(
+                    c in k.lower() for c in ['x', 'y', 'z', 'pos', 'coord', 'lat', 'lon']
+                )]
+                if coord_fields:
+                    print(f"Coordinate-like fields: {coord_fields}")
+
+                # Statistics
+                print(f"\nTotal waypoints: {len(data)}")
+                if coord_fields and len(coord_fields) >= 2:
+                    # Try to estimate track bounds
+                    x_field = coord_fields[0]
+                    z_field = coord_fields[1] if len(coord_fields) > 1 else coord_fields[0]
+
+                    x_range = value_range(data, x_field)
+                    z_range = value_range(data, z_field)
+
+                    if x_range and z_range:
+                        print(f"{x_field} range: {x_range[0]:.2f} to {x_range[1]:.2f}")
+                        print(f"{z_field} range: {z_range[0]:.2f} to {z_range[1]:.2f}")
+        else:
+            print(json.dumps(data, indent=2))
+
+        return data
+
+    except HTTPError as e:
+        # Non-200 response (HTTPError is an OSError, so handle it first)
+        print(f"Status: {e.code}")
+        print("Unexpected response code")
+        return None
+    except (HTTPException, OSError) as e:
         print(f"Connection failed: {e}")
         print("\nMake sure:")
         print("  1. LMU is running")
@@ -108,11 +125,9 @@ def main():
     print("The waypoints can be used to draw a track outline in visualizations.\n")
 
     # Test connection first
-    try:
-        req = Request(f"{BASE_URL}/rest/sessions")
-        with urlopen(req, timeout=1) as response:
-            print(f"✓ Connected to LMU REST API (status: {response.status})\n")
-    except Exception:
+    if api.is_available():
+        print("✓ Connected to LMU REST API\n")
+    else:
         print("✗ Cannot connect to LMU REST API at localhost:6397")
         print("  Make sure LMU is running and you're in a session!\n")
         sys.exit(1)
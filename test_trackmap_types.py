@@ -9,43 +9,56 @@ Usage:
     2. Run: python test_trackmap_types.py
 """
 
-import json
 import sys
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+from bisect import bisect_left
 from collections import Counter, defaultdict
+from itertools import compress, count, islice
 import math
+import operator
+
+from src.lmu_rest_api import LMURestAPI
 
 
 BASE_URL = "http://localhost:6397"
+api = LMURestAPI(BASE_URL)
+
+# guess_type_meaning(): a type whose share of waypoints is above
+# _MEANING_THRESHOLDS[i - 1] (and at most _MEANING_THRESHOLDS[i]) gets
+# _MEANING_LABELS[i]
+_MEANING_THRESHOLDS = (5, 10, 40, 80)
+_MEANING_LABELS = (
+    "Track feature",
+    "Tertiary feature (pit lane?)",
+    "Secondary feature (track edge?)",
+    "Main track feature",
+    "Racing line / Track centerline (dominant)",
+)
 
 
 def fetch_trackmap():
     """Fetch track map waypoints"""
-    url = f"{BASE_URL}/rest/watch/trackmap"
-
     try:
-        req = Request(url)
-        with urlopen(req, timeout=2) as response:
-            if response.status == 200:
-                return json.loads(response.read().decode('utf-8'))
+        return api.fetch_trackmap_waypoints()
     except Exception as e:
         print(f"Error fetching track map: {e}")
         return None
 
 
-def analyze_type_distribution(waypoints):
+def analyze_type_distribution(types):
     """Analyze distribution of type values"""
     print("\n" + "=" * 80)
     print("TYPE DISTRIBUTION ANALYSIS")
     print("=" * 80)
 
-    # Count waypoints per type
-    type_counts = Counter(w['type'] for w in waypoints)
+    # Count waypoints per type (Counter counts a list in C); sort the
+    # distinct values once for the range and the complete listing
+    type_counts = Counter(types)
+    unique_types = sorted(type_counts)
+    total = len(types)
 
-    print(f"\nTotal waypoints: {len(waypoints)}")
-    print(f"Unique type values: {len(type_counts)}")
-    print(f"Type range: {min(type_counts.keys())} to {max(type_counts.keys())}")
+    print(f"\nTotal waypoints: {total}")
+    print(f"Unique type values: {len(unique_types)}")
+    print(f"Type range: {unique_types[0]} to {unique_types[-1]}")
 
     # Show top 10 most common types
     print("\nTop 10 most common types:")
@@ -53,91 +66,77 @@ def analyze_type_distribution(waypoints):
     print("-" * 80)
 
     for type_val, count in type_counts.most_common(10):
-        pct = (count / len(waypoints)) * 100
-        desc = guess_type_meaning(type_val, count, len(waypoints))
+        pct = (count / total) * 100
+        desc = guess_type_meaning(type_val, count, total)
         print(f"{type_val:<10} {count:<10} {pct:>6.2f}%       {desc}")
 
     # Show all types if not too many
-    if len(type_counts) <= 20:
+    if len(unique_types) <= 20:
         print("\nComplete type distribution:")
         print(f"{'Type':<10} {'Count':<10} {'Percentage'}")
         print("-" * 80)
-        for type_val in sorted(type_counts.keys()):
+        for type_val in unique_types:
             count = type_counts[type_val]
-            pct = (count / len(waypoints)) * 100
+            pct = (count / total) * 100
             print(f"{type_val:<10} {count:<10} {pct:>6.2f}%")
 
+    return type_counts
+
 
 def guess_type_meaning(type_val, count, total):
     """Guess what a type value might represent"""
     pct = (count / total) * 100
 
     # Heuristics based on percentage
-    if pct > 80:
-        return "Racing line / Track centerline (dominant)"
-    elif pct > 40:
-        return "Main track feature"
-    elif pct > 10:
-        return "Secondary feature (track edge?)"
-    elif pct > 5:
-        return "Tertiary feature (pit lane?)"
-    elif pct < 1:
+    if pct < 1:
         return "Sparse markers (sector/DRS?)"
-    else:
-        return "Track feature"
+    return _MEANING_LABELS[bisect_left(_MEANING_THRESHOLDS, pct)]
 
 
-def analyze_spatial_distribution(waypoints):
+def analyze_spatial_distribution(types, xs, zs):
     """Analyze how types are distributed spatially"""
     print("\n" + "=" * 80)
     print("SPATIAL DISTRIBUTION ANALYSIS")
     print("=" * 80)
 
-    # Group by type
-    by_type = defaultdict(list)
-    for w in waypoints:
-        by_type[w['type']].append(w)
+    # Group coordinates by type
+    x_by_type = defaultdict(list)
+    z_by_type = defaultdict(list)
+    for type_val, x, z in zip(types, xs, zs):
+        x_by_type[type_val].append(x)
+        z_by_type[type_val].append(z)
 
     print(f"\nAnalyzing spatial distribution for each type...")
     print(f"{'Type':<10} {'Count':<10} {'X Range':<30} {'Z Range':<30}")
     print("-" * 80)
 
-    for type_val in sorted(by_type.keys())[:15]:  # First 15 types
-        points = by_type[type_val]
-
-        x_coords = [p['x'] for p in points]
-        z_coords = [p['z'] for p in points]
+    for type_val in sorted(x_by_type.keys())[:15]:  # First 15 types
+        x_coords = x_by_type[type_val]
+        z_coords = z_by_type[type_val]
 
         x_range = f"{min(x_coords):>8.2f} to {max(x_coords):>8.2f}"
         z_range = f"{min(z_coords):>8.2f} to {max(z_coords):>8.2f}"
 
-        print(f"{type_val:<10} {len(points):<10} {x_range:<30} {z_range:<30}")
+        print(f"{type_val:<10} {len(x_coords):<10} {x_range:<30} {z_range:<30}")
 
 
-def analyze_sequential_patterns(waypoints):
+def analyze_sequential_patterns(types):
     """Analyze if waypoints are sequential or mixed"""
     print("\n" + "=" * 80)
     print("SEQUENTIAL PATTERN ANALYSIS")
     print("=" * 80)
 
-    # Check if same types are clustered together
-    runs = []
-    current_type = waypoints[0]['type']
-    run_length = 1
-
-    for w in waypoints[1:]:
-        if w['type'] == current_type:
-            run_length += 1
-        else:
-            runs.append((current_type, run_length))
-            current_type = w['type']
-            run_length = 1
-
-    runs.append((current_type, run_length))
+    # Check if same types are clustered together: run-length encode the
+    # types by finding the indices where the type changes (map/compress
+    # keep the per-waypoint work in C)
+    changes = list(compress(count(1), map(operator.ne, types[1:], types)))
+    starts = [0] + changes
+    lengths = list(map(operator.sub, changes + [len(types)], starts))
+    runs = list(zip([types[i] for i in starts], lengths))
 
     print(f"\nTotal runs (consecutive waypoints of same type): {len(runs)}")
-    print(f"Average run length: {sum(r[1] for r in runs) / len(runs):.2f}")
-    print(f"Max run length: {max(r[1] for r in runs)}")
+    print(f"Average run length: {sum(lengths) / len(runs):.2f}")
+    print(f"Max run length: {max(lengths)}")
 
     # Show first 20 runs to see pattern
     print("\nFirst 20 type sequences:")
@@ -145,46 +144,41 @@ def analyze_sequential_patterns(waypoints):
     print("-" * 80)
 
     for type_val, length in runs[:20]:
-        pct = (length / len(waypoints)) * 100
+        pct = (length / len(types)) * 100
         print(f"{type_val:<10} {length:<15} {pct:>6.2f}%")
 
     # Determine if clustered or mixed
-    if len(runs) < len(waypoints) * 0.1:
+    if len(runs) < len(types) * 0.1:
         print("\n→ Waypoints are HIGHLY CLUSTERED by type (long runs)")
         print("  Likely: Each type represents a section of track")
-    elif len(runs) > len(waypoints) * 0.5:
+    elif len(runs) > len(types) * 0.5:
         print("\n→ Waypoints are MIXED (many short runs)")
         print("  Likely: Types represent different features at same location")
     else:
         print("\n→ Waypoints are MODERATELY CLUSTERED")
 
 
-def calculate_track_distance(waypoints):
-    """Calculate approximate track distance from waypoints"""
-    total_distance = 0.0
-
-    for i in range(1, len(waypoints)):
-        prev = waypoints[i-1]
-        curr = waypoints[i]
-
-        dx = curr['x'] - prev['x']
-        dz = curr['z'] - prev['z']
-
-        distance = math.sqrt(dx*dx + dz*dz)
-        total_distance += distance
+def calculate_track_distance(xs, zs):
+    """Calculate approximate track distance from waypoint coordinates"""
+    # Segment lengths via map() over C builtins instead of a Python-level loop
+    # (islice pairs each point with its predecessor without copying the list)
+    dxs = map(operator.sub, islice(xs, 1, None), xs)
+    dzs = map(operator.sub, islice(zs, 1, None), zs)
+    return sum(map(math.hypot, dxs, dzs), 0.0)
 
-    return total_distance
 
+def recommend_filtering_strategy(type_counts, track_dist):
+    """Recommend which waypoints to include based on analysis
 
-def recommend_filtering_strategy(waypoints):
-    """Recommend which waypoints to include based on analysis"""
+    Args:
+        type_counts: Counter of waypoints per type (from analyze_type_distribution)
+        track_dist: Track distance (from calculate_track_distance)
+    """
     print("\n" + "=" * 80)
     print("FILTERING RECOMMENDATION")
     print("=" * 80)
 
-    # Count by type
-    type_counts = Counter(w['type'] for w in waypoints)
-    total = len(waypoints)
+    total = sum(type_counts.values())
 
     # Find dominant type (likely racing line)
     dominant_type, dominant_count = type_counts.most_common(1)[0]
@@ -204,10 +198,8 @@ def recommend_filtering_strategy(waypoints):
             pct = (count / total) * 100
             print(f"   - Type {type_val}: {count} waypoints ({pct:.1f}%)")
 
-    # Calculate track distance
-    track_dist = calculate_track_distance(waypoints)
     print(f"\nApproximate track distance: {track_dist:.2f} meters")
-    print(f"Average waypoint spacing: {track_dist / len(waypoints):.2f} meters")
+    print(f"Average waypoint spacing: {track_dist / total:.2f} meters")
 
 
 def main():
@@ -218,11 +210,9 @@ def main():
     print("to help determine which waypoints to include in CSV exports.\n")
 
     # Test connection
-    try:
-        req = Request(f"{BASE_URL}/rest/sessions")
-        with urlopen(req, timeout=1) as response:
-            print(f"✓ Connected to LMU REST API (status: {response.status})\n")
-    except Exception:
+    if api.is_available():
+        print("✓ Connected to LMU REST API\n")
+    else:
         print("✗ Cannot connect to LMU REST API at localhost:6397")
         print("  Make sure LMU is running and you're in a session!\n")
         sys.exit(1)
@@ -237,11 +227,17 @@ def main():
 
     print(f"✓ Fetched {len(waypoints)} waypoints\n")
 
+    # Split waypoint dicts into per-field lists once; every analysis reads these
+    types = [w['type'] for w in waypoints]
+    xs = [w['x'] for w in waypoints]
+    zs = [w['z'] for w in waypoints]
+
     # Run analyses
-    analyze_type_distribution(waypoints)
-    analyze_spatial_distribution(waypoints)
-    analyze_sequential_patterns(waypoints)
-    recommend_filtering_strategy(waypoints)
+    type_counts = analyze_type_distribution(types)
+    analyze_spatial_distribution(types, xs, zs)
+    analyze_sequential_patterns(types)
+    track_dist = calculate_track_distance(xs, zs)
+    recommend_filtering_strategy(type_counts, track_dist)
 
     print("\n" + "=" * 80)
     print("ANALYSIS COMPLETE")
@@ -1,10 +1,12 @@
 """Tests for file manager"""
 
+import os
 import pytest
 import tempfile
 import shutil
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 from src.file_manager import FileManager
 
 
@@ -280,3 +282,88 @@ class TestFileManager:
             content = f.read()
 
         assert content == "content2"
+
+    def test_save_lap_writes_in_blocks(self, temp_dir):
+        """Should write identical UTF-8 content regardless of block size"""
+        manager = FileManager({'output_dir': str(temp_dir), 'write_buffer_bytes': 7})
+
+        csv_content = "Player,José Fernández\n" + "1.000,2.00,3.00\n" * 50
+        filepath = manager.save_lap(csv_content, {'lap': 1}, build_session_info())
+
+        with open(filepath, 'rb') as f:
+            assert f.read() == csv_content.encode('utf-8')
+
+    def test_save_lap_async_writes_after_flush(self, temp_dir):
+        """Should write queued laps in the background and finish on flush()"""
+        manager = FileManager({'output_dir': str(temp_dir)})
+
+        filepaths = [
+            manager.save_lap_async(f"content{i}", {'lap': i}, build_session_info())
+            for i in range(1, 4)
+        ]
+        manager.flush()
+
+        for i, filepath in enumerate(filepaths, start=1):
+            with open(filepath, 'r') as f:
+                assert f.read() == f"content{i}"
+
+    def test_save_lap_async_reports_written_file(self, temp_dir):
+        """on_saved should be called with the path only after the file is written"""
+        manager = FileManager({'output_dir': str(temp_dir)})
+        saved = []
+
+        filepath = manager.save_lap_async(
+            "content", {'lap': 1}, build_session_info(),
+            on_saved=lambda path: saved.append(os.path.exists(path) and path)
+        )
+        manager.flush()
+
+        assert saved == [filepath]
+
+    def test_save_lap_async_reports_write_errors(self, temp_dir):
+        """on_error should receive failed writes instead of on_saved"""
+        manager = FileManager({'output_dir': str(temp_dir)})
+        saved, errors = [], []
+
+        with patch.object(manager, '_write_bytes', side_effect=OSError("disk full")):
+            filepath = manager.save_lap_async(
+                "content", {'lap': 1}, build_session_info(),
+                on_saved=saved.append,
+                on_error=lambda path, error: errors.append((path, str(error)))
+            )
+            manager.flush()
+
+        assert saved == []
+        assert errors == [(filepath, "disk full")]
+
+    def test_custom_filename_format_with_format_spec(self, temp_dir):
+        """Should honour format specs and escaped braces like str.format"""
+        manager = FileManager({
+            'output_dir': str(temp_dir),
+            'filename_format': '{track}_{{x}}_lap{lap:03d}.csv'
+        })
+
+        filepath = manager.save_lap("test", {'lap': 7}, build_session_info(track_name='Spa'))
+
+        assert Path(filepath).name == 'spa_{x}_lap007.csv'
+
+    def test_list_saved_laps_ignores_other_entries(self, temp_dir):
+        """Should only list .csv files, not other files or directories"""
+        manager = FileManager({'output_dir': str(temp_dir)})
+        manager.save_lap("test", {'lap': 1}, build_session_info())
+        (temp_dir / 'notes.txt').write_text('x')
+        (temp_dir / 'folder.csv').mkdir()
+
+        laps = manager.list_saved_laps()
+        assert len(laps) == 1
+        assert laps[0].endswith('.csv')
+
+    def test_get_session_laps_matches_literal_substring(self, temp_dir):
+        """Should treat the filter as a literal substring, not a glob pattern"""
+        manager = FileManager({'output_dir': str(temp_dir)})
+
+        manager.save_lap("test", {'lap': 1}, build_session_info(session_id='run[1]'))
+        manager.save_lap("test", {'lap': 1}, build_session_info(session_id='run1'))
+
+        assert len(manager.get_session_laps('run[1]')) == 1
+        assert len(manager.get_session_laps('run1')) == 1
@@ -0,0 +1,150 @@
+"""
+Tests for LMU REST API client transport
+
+Covers the persistent keep-alive connection and the cached is_available()
+check, using a local HTTP server in place of LMU.
+"""
+
+import json
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.error import HTTPError
+from src.lmu_rest_api import LMURestAPI
+
+
+SAMPLE_VEHICLES_RESPONSE = [
+    {
+        "vehicle": "Action Express Racing #311:LM 1.41",
+        "fullPathTree": "WEC 2023, Hypercar, Cadillac V-Series.R",
+        "classes": ["Cadillac_V_lmdh", "Hypercar", "WEC2023"],
+        "manufacturer": "Cadillac",
+        "team": "Action Express Racing",
+    },
+]
+
+
+class _FakeLMUHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive handler serving the endpoints the client uses"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.requests.append((self.client_address, self.path))
+
+        if self.path == '/rest/sessions':
+            self._send(200, b'{}')
+        elif self.path == '/rest/drop':
+            # Respond as keep-alive, then close the idle connection anyway
+            self._send(200, b'{}')
+            self.close_connection = True
+        elif self.path == '/rest/sessions/getAllVehicles':
+            self._send(200, json.dumps(SAMPLE_VEHICLES_RESPONSE).encode('utf-8'))
+        else:
+            self._send(404, b'not found')
+
+    def _send(self, status, body):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestLMURestAPITransport:
+    """Tests for the persistent connection used by LMURestAPI"""
+
+    @pytest.fixture
+    def server(self):
+        """Run a local keep-alive HTTP server for the duration of a test"""
+        httpd = ThreadingHTTPServer(('127.0.0.1', 0), _FakeLMUHandler)
+        httpd.requests = []
+        thread = threading.Thread(
+            target=httpd.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True
+        )
+        thread.start()
+        yield httpd
+        httpd.shutdown()
+        httpd.server_close()
+
+    def test_requests_reuse_one_connection(self, server):
+        """Multiple requests should share a single keep-alive connection"""
+        api = LMURestAPI(f"http://127.0.0.1:{server.server_port}")
+
+        assert api.is_available() is True
+        vehicles = api.fetch_vehicle_data()
+        api.close()
+
+        assert vehicles["Action Express Racing #311:LM 1.41"]["class"] == "Hypercar"
+        assert len(server.requests) == 2
+        # Same client address (source port) means the TCP connection was reused
+        assert server.requests[0][0] == server.requests[1][0]
+
+    def test_reconnects_after_connection_closed(self, server):
+        """Should transparently reconnect if the connection was dropped"""
+        api = LMURestAPI(f"http://127.0.0.1:{server.server_port}")
+
+        api._http_get("/rest/drop", timeout=1)
+        body = api._http_get("/rest/sessions", timeout=1)
+        api.close()
+
+        assert body == b'{}'
+        assert server.requests[0][0] != server.requests[1][0]
+
+    def test_retries_after_connection_aborted(self, server):
+        """Should reconnect if writing to the idle connection is aborted (Windows)"""
+        api = LMURestAPI(f"http://127.0.0.1:{server.server_port}")
+        api._http_get("/rest/sessions", timeout=1)
+
+        with patch.object(api._conn, 'request', side_effect=ConnectionAbortedError()):
+            body = api._http_get("/rest/sessions", timeout=1)
+        api.close()
+
+        assert body == b'{}'
+        assert len(server.requests) == 2
+        assert server.requests[0][0] != server.requests[1][0]
+
+    def test_non_200_raises_http_error(self, server):
+        """Non-200 responses should raise HTTPError"""
+        api = LMURestAPI(f"http://127.0.0.1:{server.server_port}")
+
+        with pytest.raises(HTTPError):
+            api._http_get("/rest/unknown", timeout=1)
+        api.close()
+
+    def test_is_available_false_when_unreachable(self):
+        """Should return False when nothing is listening"""
+        api = LMURestAPI("http://127.0.0.1:1")
+
+        assert api.is_available() is False
+
+    def test_is_available_result_is_cached(self):
+        """Repeated checks within the TTL should not probe the API again"""
+        api = LMURestAPI()
+
+        with patch.object(LMURestAPI, '_http_get', return_value=b'{}') as mock_http_get:
+            assert api.is_available() is True
+            assert api.is_available() is True
+
+        assert mock_http_get.call_count == 1
+
+
+class TestLMURestAPIVehicleLookup:
+    """Tests for vehicle metadata lookup"""
+
+    def test_lookup_matches_name_without_version_suffix(self):
+        """Shared memory names lack the version suffix the REST API adds"""
+        api = LMURestAPI()
+
+        with patch.object(LMURestAPI, '_http_get') as mock_http_get:
+            mock_http_get.return_value = json.dumps(SAMPLE_VEHICLES_RESPONSE).encode('utf-8')
+            exact = api.lookup_vehicle("Action Express Racing #311:LM 1.41")
+            fuzzy = api.lookup_vehicle("Action Express Racing #311:LM")
+
+        assert fuzzy is exact
+        assert fuzzy["manufacturer"] == "Cadillac"
+        assert api.lookup_vehicle("Action Express Racing #31") is None
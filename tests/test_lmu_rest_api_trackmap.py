@@ -7,7 +7,7 @@ waypoints from the LMU REST API /rest/watch/trackmap endpoint.
 
 import json
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 from src.lmu_rest_api import LMURestAPI
 
 
@@ -39,24 +39,36 @@ SAMPLE_TRACKMAP_RESPONSE = [
     {"type": 3, "x": -36.22, "y": 38.20, "z": -344.90},
 ]
 
+# Encoded once; every test's mocked API response body
+SAMPLE_TRACKMAP_BYTES = json.dumps(SAMPLE_TRACKMAP_RESPONSE).encode('utf-8')
+
+
+@pytest.fixture(scope='class')
+def _patched_http_get():
+    """Patch LMURestAPI._http_get once for a whole test class"""
+    with patch.object(LMURestAPI, '_http_get') as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_http_get(_patched_http_get):
+    """LMURestAPI._http_get mock, reset to return SAMPLE_TRACKMAP_RESPONSE
+
+    Tests can reconfigure return_value / side_effect on the returned mock.
+    """
+    _patched_http_get.reset_mock(return_value=True, side_effect=True)
+    _patched_http_get.return_value = SAMPLE_TRACKMAP_BYTES
+    return _patched_http_get
+
 
 class TestGetTrackmap:
     """Tests for get_trackmap() method"""
 
-    def test_get_trackmap_success(self):
+    def test_get_trackmap_success(self, mock_http_get):
         """Test successful track map fetch"""
         api = LMURestAPI()
 
-        # Mock the API response
-        with patch('src.lmu_rest_api.urlopen') as mock_urlopen:
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = json.dumps(SAMPLE_TRACKMAP_RESPONSE).encode('utf-8')
-            mock_response.__enter__ = Mock(return_value=mock_response)
-            mock_response.__exit__ = Mock(return_value=False)
-            mock_urlopen.return_value = mock_response
-
-            result = api.get_trackmap()
+        result = api.get_trackmap()
 
         # Should return dict with track and pit_lane
         assert isinstance(result, dict)
@@ -79,19 +91,11 @@ class TestGetTrackmap:
         assert result['waypoint_count'] == 15
         assert result['source'] == 'LMU_REST_API'
 
-    def test_get_trackmap_filters_pit_bays(self):
+    def test_get_trackmap_filters_pit_bays(self, mock_http_get):
         """Test that pit bays (types 2+) are filtered out"""
         api = LMURestAPI()
 
-        with patch('src.lmu_rest_api.urlopen') as mock_urlopen:
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = json.dumps(SAMPLE_TRACKMAP_RESPONSE).encode('utf-8')
-            mock_response.__enter__ = Mock(return_value=mock_response)
-            mock_response.__exit__ = Mock(return_value=False)
-            mock_urlopen.return_value = mock_response
-
-            result = api.get_trackmap()
+        result = api.get_trackmap()
 
         # Should NOT include pit bay waypoints (types 2, 3, etc.)
         # Total should be 15, not 19
@@ -101,142 +105,102 @@ class TestGetTrackmap:
         all_coords = result['track'] + result['pit_lane']
         assert [-37.29, -351.83] not in all_coords  # Type 2 pit bay
 
-    def test_get_trackmap_caches_by_track_name(self):
+    def test_get_trackmap_caches_by_track_name(self, mock_http_get):
         """Test that track maps are cached by track name"""
         api = LMURestAPI()
 
-        with patch('src.lmu_rest_api.urlopen') as mock_urlopen:
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = json.dumps(SAMPLE_TRACKMAP_RESPONSE).encode('utf-8')
-            mock_response.__enter__ = Mock(return_value=mock_response)
-            mock_response.__exit__ = Mock(return_value=False)
-            mock_urlopen.return_value = mock_response
+        # First call - should fetch from API
+        result1 = api.get_trackmap(track_name="Bahrain")
 
-            # First call - should fetch from API
-            result1 = api.get_trackmap(track_name="Bahrain")
+        # Second call with same track - should return cached
+        result2 = api.get_trackmap(track_name="Bahrain")
 
-            # Second call with same track - should return cached
-            result2 = api.get_trackmap(track_name="Bahrain")
+        # Should only have called API once
+        assert mock_http_get.call_count == 1
 
-            # Should only have called API once
-            assert mock_urlopen.call_count == 1
+        # Results should be identical
+        assert result1 == result2
 
-            # Results should be identical
-            assert result1 == result2
-
-    def test_get_trackmap_different_tracks(self):
+    def test_get_trackmap_different_tracks(self, mock_http_get):
         """Test that different tracks are cached separately"""
         api = LMURestAPI()
 
-        with patch('src.lmu_rest_api.urlopen') as mock_urlopen:
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = json.dumps(SAMPLE_TRACKMAP_RESPONSE).encode('utf-8')
-            mock_response.__enter__ = Mock(return_value=mock_response)
-            mock_response.__exit__ = Mock(return_value=False)
-            mock_urlopen.return_value = mock_response
-
-            # Fetch for two different tracks
-            result1 = api.get_trackmap(track_name="Bahrain")
-            result2 = api.get_trackmap(track_name="Spa")
+        # Fetch for two different tracks
+        result1 = api.get_trackmap(track_name="Bahrain")
+        result2 = api.get_trackmap(track_name="Spa")
 
-            # Should have called API twice (different tracks)
-            assert mock_urlopen.call_count == 2
+        # Should have called API twice (different tracks)
+        assert mock_http_get.call_count == 2
 
-    def test_get_trackmap_force_refresh(self):
+    def test_get_trackmap_force_refresh(self, mock_http_get):
         """Test force refresh bypasses cache"""
         api = LMURestAPI()
 
-        with patch('src.lmu_rest_api.urlopen') as mock_urlopen:
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = json.dumps(SAMPLE_TRACKMAP_RESPONSE).encode('utf-8')
-            mock_response.__enter__ = Mock(return_value=mock_response)
-            mock_response.__exit__ = Mock(return_value=False)
-            mock_urlopen.return_value = mock_response
+        # First call
+        api.get_trackmap(track_name="Bahrain")
 
-            # First call
-            api.get_trackmap(track_name="Bahrain")
+        # Second call with force_refresh
+        api.get_trackmap(track_name="Bahrain", force_refresh=True)
 
-            # Second call with force_refresh
-            api.get_trackmap(track_name="Bahrain", force_refresh=True)
+        # Should have called API twice
+        assert mock_http_get.call_count == 2
 
-            # Should have called API twice
-            assert mock_urlopen.call_count == 2
-
-    def test_get_trackmap_api_unavailable(self):
+    def test_get_trackmap_api_unavailable(self, mock_http_get):
         """Test graceful handling when API is unavailable"""
         api = LMURestAPI()
+        mock_http_get.side_effect = ConnectionRefusedError()
 
-        with patch('src.lmu_rest_api.urlopen', side_effect=ConnectionRefusedError()):
-            result = api.get_trackmap()
+        result = api.get_trackmap()
 
         # Should return empty dict
         assert result == {}
 
-    def test_get_trackmap_http_error(self):
+    def test_get_trackmap_http_error(self, mock_http_get):
         """Test handling of HTTP errors"""
         api = LMURestAPI()
 
-        with patch('src.lmu_rest_api.urlopen') as mock_urlopen:
-            from urllib.error import HTTPError
-            mock_urlopen.side_effect = HTTPError(
-                url="http://localhost:6397/rest/watch/trackmap",
-                code=404,
-                msg="Not Found",
-                hdrs={},
-                fp=None
-            )
+        from urllib.error import HTTPError
+        mock_http_get.side_effect = HTTPError(
+            url="http://localhost:6397/rest/watch/trackmap",
+            code=404,
+            msg="Not Found",
+            hdrs={},
+            fp=None
+        )
 
-            result = api.get_trackmap()
+        result = api.get_trackmap()
 
         # Should return empty dict
         assert result == {}
 
-    def test_get_trackmap_timeout(self):
+    def test_get_trackmap_timeout(self, mock_http_get):
         """Test handling of timeouts"""
         api = LMURestAPI()
 
-        with patch('src.lmu_rest_api.urlopen') as mock_urlopen:
-            import socket
-            mock_urlopen.side_effect = socket.timeout()
+        import socket
+        mock_http_get.side_effect = socket.timeout()
 
-            result = api.get_trackmap()
+        result = api.get_trackmap()
 
         # Should return empty dict
         assert result == {}
 
-    def test_get_trackmap_invalid_json(self):
+    def test_get_trackmap_invalid_json(self, mock_http_get):
         """Test handling of invalid JSON response"""
         api = LMURestAPI()
+        mock_http_get.return_value = b"invalid json{{"
 
-        with patch('src.lmu_rest_api.urlopen') as mock_urlopen:
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = b"invalid json{{"
-            mock_response.__enter__ = Mock(return_value=mock_response)
-            mock_response.__exit__ = Mock(return_value=False)
-            mock_urlopen.return_value = mock_response
-
-            result = api.get_trackmap()
+        result = api.get_trackmap()
 
         # Should return empty dict on JSON parse error
         assert result == {}
 
-    def test_get_trackmap_empty_response(self):
+    def test_get_trackmap_empty_response(self, mock_http_get):
         """Test handling of empty waypoint list"""
         api = LMURestAPI()
+        mock_http_get.return_value = json.dumps([]).encode('utf-8')
 
-        with patch('src.lmu_rest_api.urlopen') as mock_urlopen:
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = json.dumps([]).encode('utf-8')
-            mock_response.__enter__ = Mock(return_value=mock_response)
-            mock_response.__exit__ = Mock(return_value=False)
-            mock_urlopen.return_value = mock_response
-
-            result = api.get_trackmap()
+        result = api.get_trackmap()
 
         # Should return empty lists
         assert result == {
@@ -246,48 +210,106 @@ class TestGetTrackmap:
             'source': 'LMU_REST_API'
         }
 
-    def test_get_trackmap_only_type0(self):
+    def test_get_trackmap_only_type0(self, mock_http_get):
         """Test track map with only Type 0 waypoints (no pit lane)"""
         api = LMURestAPI()
 
         # Response with only Type 0
         type0_only = [w for w in SAMPLE_TRACKMAP_RESPONSE if w['type'] == 0]
+        mock_http_get.return_value = json.dumps(type0_only).encode('utf-8')
 
-        with patch('src.lmu_rest_api.urlopen') as mock_urlopen:
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = json.dumps(type0_only).encode('utf-8')
-            mock_response.__enter__ = Mock(return_value=mock_response)
-            mock_response.__exit__ = Mock(return_value=False)
-            mock_urlopen.return_value = mock_response
-
-            result = api.get_trackmap()
+        result = api.get_trackmap()
 
         # Should have track but empty pit_lane
         assert len(result['track']) == 10
         assert len(result['pit_lane']) == 0
         assert result['waypoint_count'] == 10
 
-    def test_clear_trackmap_cache(self):
+    def test_clear_trackmap_cache(self, mock_http_get):
         """Test clearing track map cache"""
         api = LMURestAPI()
 
-        with patch('src.lmu_rest_api.urlopen') as mock_urlopen:
-            mock_response = Mock()
-            mock_response.status = 200
-            mock_response.read.return_value = json.dumps(SAMPLE_TRACKMAP_RESPONSE).encode('utf-8')
-            mock_response.__enter__ = Mock(return_value=mock_response)
-            mock_response.__exit__ = Mock(return_value=False)
-            mock_urlopen.return_value = mock_response
+        # Fetch and cache
+        api.get_trackmap(track_name="Bahrain")
+
+        # Clear cache
+        api.clear_cache()
+
+        # Fetch again - should call API again
+        api.get_trackmap(track_name="Bahrain")
+
+        # Should have called API twice
+        assert mock_http_get.call_count == 2
+
+
+class TestFetchTrackmapWaypoints:
+    """Tests for fetch_trackmap_waypoints() method"""
 
-            # Fetch and cache
-            api.get_trackmap(track_name="Bahrain")
+    def test_returns_all_raw_waypoints(self, mock_http_get):
+        """Should return every waypoint (including pit bays) from the endpoint"""
+        api = LMURestAPI()
+
+        waypoints = api.fetch_trackmap_waypoints()
+
+        assert waypoints == SAMPLE_TRACKMAP_RESPONSE
+        assert mock_http_get.call_args[0][0] == "/rest/watch/trackmap"
+
+
+class TestTrackmapDiskCache:
+    """Tests for the optional on-disk track map cache"""
+
+    def test_disk_cache_survives_new_client(self, mock_http_get, tmp_path):
+        """A new client with the same cache dir should not call the API again"""
+        first = LMURestAPI(trackmap_cache_dir=str(tmp_path)).get_trackmap(track_name="Bahrain")
+        second = LMURestAPI(trackmap_cache_dir=str(tmp_path)).get_trackmap(track_name="Bahrain")
+
+        assert mock_http_get.call_count == 1
+        assert second == first
+
+    def test_clear_cache_removes_disk_cache(self, mock_http_get, tmp_path):
+        """clear_cache() should also drop track maps saved on disk"""
+        api = LMURestAPI(trackmap_cache_dir=str(tmp_path))
+
+        api.get_trackmap(track_name="Bahrain")
+        api.clear_cache()
+
+        assert list(tmp_path.iterdir()) == []
+        api.get_trackmap(track_name="Bahrain")
+        assert mock_http_get.call_count == 2
+
+    def test_disk_cache_ignores_other_track_with_same_filename(self, mock_http_get, tmp_path):
+        """Track names that sanitize to the same filename must not share a map"""
+        LMURestAPI(trackmap_cache_dir=str(tmp_path)).get_trackmap(track_name="Spa/2024")
+
+        api = LMURestAPI(trackmap_cache_dir=str(tmp_path))
+        api.get_trackmap(track_name="Spa_2024")
+
+        assert mock_http_get.call_count == 2
+
+    def test_empty_trackmap_is_not_cached(self, mock_http_get, tmp_path):
+        """An empty API response should be fetched again, not cached"""
+        mock_http_get.return_value = json.dumps([]).encode('utf-8')
+        api = LMURestAPI(trackmap_cache_dir=str(tmp_path))
+
+        api.get_trackmap(track_name="Bahrain")
+        assert list(tmp_path.iterdir()) == []
+
+        mock_http_get.return_value = SAMPLE_TRACKMAP_BYTES
+        result = api.get_trackmap(track_name="Bahrain")
+
+        assert mock_http_get.call_count == 2
+        assert len(result['track']) == 10
 
-            # Clear cache
-            api.clear_cache()
+    def test_disk_cache_matches_fresh_fetch_text(self, mock_http_get, tmp_path):
+        """Cached coordinates should format the same as freshly fetched ones"""
+        mock_http_get.return_value = json.dumps([
+            {"type": 0, "x": 1, "y": 0, "z": -2},
+            {"type": 1, "x": 3, "y": 0, "z": 4.5},
+        ]).encode('utf-8')
 
-            # Fetch again - should call API again
-            api.get_trackmap(track_name="Bahrain")
+        fresh = LMURestAPI(trackmap_cache_dir=str(tmp_path)).get_trackmap(track_name="Bahrain")
+        cached = LMURestAPI(trackmap_cache_dir=str(tmp_path)).get_trackmap(track_name="Bahrain")
 
-            # Should have called API twice
-            assert mock_urlopen.call_count == 2
+        assert mock_http_get.call_count == 1
+        assert str(cached['track']) == str(fresh['track']) == '[[1.0, -2.0]]'
+        assert str(cached['pit_lane']) == str(fresh['pit_lane'])
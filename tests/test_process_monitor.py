@@ -1,5 +1,9 @@
 """Tests for process monitor"""
 
+import subprocess
+import sys
+
+import psutil
 import pytest
 from src.process_monitor import ProcessMonitor
 
@@ -35,3 +39,39 @@ class TestProcessMonitor:
         monitor = ProcessMonitor({})
         # Default should be LMU.exe
         assert monitor.target_process == 'LMU.exe'
+
+    def test_reuses_detected_process(self):
+        """Should trust the previously detected process until it exits"""
+        child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])
+        monitor = ProcessMonitor({'target_process': 'definitely_not_a_real_process_name_xyz123'})
+        try:
+            monitor._process = psutil.Process(child.pid)
+            assert monitor.is_running() is True
+        finally:
+            child.kill()
+            child.wait()
+
+        assert monitor.is_running() is False
+        assert monitor._process is None
+
+    def test_wait_for_process_backs_off_until_timeout(self, monkeypatch):
+        """Should poll with growing delays and stop at the timeout"""
+        monitor = ProcessMonitor({'target_process': 'definitely_not_a_real_process_name_xyz123'})
+        monkeypatch.setattr(monitor, 'is_running', lambda: False)
+
+        clock = [0.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr('src.process_monitor.time.time', lambda: clock[0])
+        monkeypatch.setattr('src.process_monitor.time.sleep', fake_sleep)
+
+        assert monitor.wait_for_process(timeout=3.0) is False
+
+        assert sleeps[0] == pytest.approx(0.1)
+        assert sleeps[1] == pytest.approx(0.15)
+        assert all(b >= a for a, b in zip(sleeps, sleeps[1:-1]))
+        assert sum(sleeps) == pytest.approx(3.0)
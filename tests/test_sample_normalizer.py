@@ -41,6 +41,15 @@ class TestSampleNormalizer:
 
         assert sample['Sector [int]'] == 1
 
+    def test_sector_estimation_clamps_to_track(self):
+        normalizer = SampleNormalizer()
+
+        past_line = normalizer.normalize({'lap_distance': 950.0, 'track_length': 900.0})
+        before_line = normalizer.normalize({'lap_distance': -5.0, 'track_length': 900.0})
+
+        assert past_line['Sector [int]'] == 2
+        assert before_line['Sector [int]'] == 0
+
     def test_sector_uses_boundaries_when_available(self):
         """Test that sector calculation uses actual boundaries instead of equal division"""
         normalizer = SampleNormalizer()
@@ -76,6 +76,21 @@ class TestSessionManager:
 
         assert len(manager.get_lap_data()) == 0
 
+    def test_take_lap_data_transfers_buffer(self):
+        """Should hand over the buffered samples and leave an empty buffer"""
+        manager = SessionManager()
+
+        manager.add_sample({'lap': 1, 'lap_distance': 50.0, 'lap_time': 0.5})
+        manager.add_sample({'lap': 1, 'lap_distance': 90.0, 'lap_time': 0.9})
+
+        buffer = manager.lap_samples
+        lap_data = manager.take_lap_data()
+
+        assert lap_data is buffer
+        assert len(lap_data) == 2
+        assert manager.sample_count == 0
+        assert manager.last_lap_time == 0.0
+
     def test_state_transitions(self):
         """Should transition states correctly"""
         manager = SessionManager()
@@ -1,10 +1,17 @@
 """Tests for mock telemetry reader"""
 
 import pytest
-import time
 from src.telemetry.telemetry_mock import MockTelemetryReader
 
 
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace the mock reader's clock; advance it by adding to fake_clock[0]"""
+    clock = [1000.0]
+    monkeypatch.setattr('src.telemetry.telemetry_mock.time.perf_counter', lambda: clock[0])
+    return clock
+
+
 class TestMockTelemetryReader:
     """Test suite for MockTelemetryReader"""
 
@@ -23,6 +30,15 @@ class TestMockTelemetryReader:
         assert 'car_name' in session_info
         assert session_info['track_name'] == "Bahrain International Circuit"
 
+    def test_session_info_is_mutable_copy(self):
+        """Callers add session_id/metadata, so each call needs its own dict"""
+        reader = MockTelemetryReader()
+
+        info = reader.get_session_info()
+        info['session_id'] = '20250101120000'
+
+        assert 'session_id' not in reader.get_session_info()
+
     def test_read_returns_valid_data(self):
         """Should return dictionary with all required fields"""
         reader = MockTelemetryReader()
@@ -39,7 +55,7 @@ class TestMockTelemetryReader:
         assert isinstance(data['speed'], (int, float))
         assert isinstance(data['lap_distance'], (int, float))
 
-    def test_lap_progression(self):
+    def test_lap_progression(self, fake_clock):
         """Lap distance should increase over time"""
         reader = MockTelemetryReader()
 
@@ -47,8 +63,8 @@ class TestMockTelemetryReader:
         data1 = reader.read()
         initial_distance = data1['lap_distance']
 
-        # Wait a bit
-        time.sleep(0.1)
+        # Advance time a bit
+        fake_clock[0] += 0.1
 
         # Read again
         data2 = reader.read()
@@ -57,7 +73,7 @@ class TestMockTelemetryReader:
         # Distance should have increased
         assert new_distance > initial_distance
 
-    def test_lap_increment(self):
+    def test_lap_increment(self, fake_clock):
         """Lap number should increment when lap completes"""
         # Set a very short track for faster testing
         reader = MockTelemetryReader()
@@ -65,8 +81,8 @@ class TestMockTelemetryReader:
 
         initial_lap = reader.read()['lap']
 
-        # Wait for lap to complete (~1.5 seconds at 70 m/s)
-        time.sleep(2)
+        # Advance past lap completion (~1.5 seconds at 70 m/s)
+        fake_clock[0] += 2
 
         new_lap = reader.read()['lap']
 
@@ -102,3 +118,15 @@ class TestMockTelemetryReader:
             assert 'rr' in data[field]
             assert 'fl' in data[field]
             assert 'fr' in data[field]
+
+    def test_reads_return_independent_dicts(self):
+        """Each read should return a new dict so buffered samples stay intact"""
+        reader = MockTelemetryReader()
+
+        data1 = reader.read()
+        data2 = reader.read()
+
+        assert data1 is not data2
+        data2['gear'] = 3
+        assert data1['gear'] == 6
+        assert reader.read()['gear'] == 6
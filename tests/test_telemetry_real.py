@@ -163,3 +163,13 @@ class TestRealTelemetryReader:
         # At lap start, lap_time should be 0.0
         assert data['lap_time'] == pytest.approx(0.0, abs=0.001), \
             f"Expected lap_time=0.0s at lap start, got {data['lap_time']}s"
+
+    def test_rest_api_uses_persistent_trackmap_cache(self, mock_rf2_module, monkeypatch, tmp_path):
+        """REST API client should cache track maps in the app data directory"""
+        monkeypatch.setattr('src.telemetry.telemetry_real.get_trackmap_cache_dir', lambda: tmp_path / 'trackmap_cache')
+
+        from src.telemetry.telemetry_real import RealTelemetryReader
+
+        reader = RealTelemetryReader()
+
+        assert reader.rest_api.trackmap_cache_dir == str(tmp_path / 'trackmap_cache')
@@ -27,7 +27,7 @@ class TestTrayUI(unittest.TestCase):
         self.mock_app.telemetry_loop.session_manager = Mock()
         self.mock_app.telemetry_loop.session_manager.state = SessionState.IDLE
         self.mock_app.telemetry_loop.session_manager.current_lap = 0
-        self.mock_app.telemetry_loop.session_manager.lap_samples = []
+        self.mock_app.telemetry_loop.session_manager.sample_count = 0
         self.mock_app.file_manager = Mock()
         self.mock_app.file_manager.get_output_directory.return_value = '/test/output'
 
@@ -162,7 +162,7 @@ class TestTrayUI(unittest.TestCase):
     def test_get_status_text_logging(self):
         """Test get_status_text returns correct text for LOGGING state"""
         self.mock_app.telemetry_loop.session_manager.current_lap = 5
-        self.mock_app.telemetry_loop.session_manager.lap_samples = [1] * 234
+        self.mock_app.telemetry_loop.session_manager.sample_count = 234
 
         tray = TrayUI(self.mock_app)
         tray.state = SessionState.LOGGING
@@ -224,22 +224,31 @@ class TrayTelemetryApp:
             metadata=metadata,
         )
 
-        # Save to file
+        # Queue for the background writer so the telemetry thread isn't blocked on disk I/O.
+        # The lap is counted and logged as saved only once the writer has written it.
+        sample_count = len(lap_data)
         try:
-            filepath = self.file_manager.save_lap(
+            self.file_manager.save_lap_async(
                 csv_content=csv_content,
                 lap_summary=lap_summary,
-                session_info=session_info
+                session_info=session_info,
+                on_saved=lambda filepath: self._on_lap_saved(filepath, sample_count),
+                on_error=self._on_lap_save_error
             )
 
-            self.laps_saved += 1
-            self.samples_collected += len(lap_data)
-
-            logger.info(f"Saved to: {filepath}")
-
         except Exception as e:
             logger.error(f"Error saving lap: {e}")
 
+    def _on_lap_saved(self, filepath: str, sample_count: int):
+        """Writer thread callback: a player lap file has been written"""
+        self.laps_saved += 1
+        self.samples_collected += sample_count
+        logger.info(f"Saved to: {filepath}")
+
+    def _on_lap_save_error(self, filepath: str, error: Exception):
+        """Writer thread callback: writing a lap file failed"""
+        logger.error(f"Error saving lap to {filepath}: {error}")
+
     def on_opponent_lap_complete(self, opponent_lap_data):
         """
         Callback when an opponent completes a lap
@@ -301,19 +310,23 @@ class TrayTelemetryApp:
 
             opponent_filename_format = '{session_id}_{track}_{car}_{driver}_lap{lap}_t{lap_time}s.csv'
 
-            filepath = self.file_manager.save_lap(
+            self.file_manager.save_lap_async(
                 csv_content=csv_content,
                 lap_summary=lap_summary,
                 session_info=session_info,
-                filename_format=opponent_filename_format
+                filename_format=opponent_filename_format,
+                on_saved=self._on_opponent_lap_saved,
+                on_error=self._on_lap_save_error
             )
 
-            self.opponent_laps_saved += 1
-            logger.info(f"Saved opponent lap to: {filepath}")
-
         except Exception as e:
             logger.error(f"Error saving opponent lap: {e}")
 
+    def _on_opponent_lap_saved(self, filepath: str):
+        """Writer thread callback: an opponent lap file has been written"""
+        self.opponent_laps_saved += 1
+        logger.info(f"Saved opponent lap to: {filepath}")
+
     def _get_track_name(self) -> str:
         """Get current track name from session info"""
         info = self.telemetry_reader.get_session_info()
@@ -452,11 +465,14 @@ class TrayTelemetryApp:
         )
         self.telemetry_thread.start()
 
-        # Run tray UI in main thread (required by pystray)
+        # Run tray UI in main thread (required by pystray). It returns on Quit
+        # as well as Ctrl+C; stop() must run on both so queued laps are written
+        # before the interpreter kills the background writer thread.
         try:
             self.tray_ui.start()
         except KeyboardInterrupt:
             logger.info("Shutting down...")
+        finally:
             self.stop()
 
     def stop(self):
@@ -468,6 +484,9 @@ class TrayTelemetryApp:
         if self.telemetry_thread and self.telemetry_thread.is_alive():
             self.telemetry_thread.join(timeout=2.0)
 
+        # Make sure queued laps are on disk before exiting
+        self.file_manager.flush()
+
         logger.info("=" * 60)
         logger.info("Session Summary")
         logger.info("=" * 60)
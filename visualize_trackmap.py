@@ -14,32 +14,51 @@ Usage:
     3. View: trackmap_visualization.png
 """
 
-import json
 import sys
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from collections import defaultdict
+
+from src.lmu_rest_api import LMURestAPI
 
 
 BASE_URL = "http://localhost:6397"
 
+# Let Agg stroke the long track polylines in chunks instead of one huge path
+plt.rcParams['agg.path.chunksize'] = 10000
+
+api = LMURestAPI(BASE_URL)
+
 
 def fetch_trackmap():
     """Fetch track map waypoints from REST API"""
-    url = f"{BASE_URL}/rest/watch/trackmap"
-
     try:
-        req = Request(url)
-        with urlopen(req, timeout=2) as response:
-            if response.status == 200:
-                return json.loads(response.read().decode('utf-8'))
+        return api.fetch_trackmap_waypoints()
     except Exception as e:
         print(f"Error fetching track map: {e}")
         return None
 
 
+def waypoint_arrays(waypoints):
+    """
+    Split waypoint dicts into type/x/z arrays in one pass
+
+    Coordinates are stored as float32: sub-millimetre precision over a
+    track's extent is plenty for plotting, at half the memory of float64.
+
+    Args:
+        waypoints: List of waypoint dicts with type, x, y, z fields
+
+    Returns:
+        (types, xs, zs) NumPy arrays
+    """
+    count = len(waypoints)
+    types = np.fromiter((w['type'] for w in waypoints), dtype=np.int32, count=count)
+    xs = np.fromiter((w['x'] for w in waypoints), dtype=np.float32, count=count)
+    zs = np.fromiter((w['z'] for w in waypoints), dtype=np.float32, count=count)
+    return types, xs, zs
+
+
 def visualize_trackmap(waypoints, output_file='trackmap_visualization.png'):
     """
     Create a 2D visualization of track map waypoints
@@ -50,18 +69,31 @@ def visualize_trackmap(waypoints, output_file='trackmap_visualization.png'):
     """
     print(f"\nCreating visualization with {len(waypoints)} waypoints...")
 
-    # Group waypoints by type
-    by_type = defaultdict(list)
-    for w in waypoints:
-        by_type[w['type']].append(w)
+    types, xs, zs = waypoint_arrays(waypoints)
+
+    # Group waypoints by type: index arrays into xs/zs, one per unique type
+    unique_types, first_seen, inverse, type_sizes = np.unique(
+        types, return_index=True, return_inverse=True, return_counts=True
+    )
+    by_type = {
+        type_val: np.flatnonzero(inverse == i)
+        for i, type_val in enumerate(unique_types.tolist())
+    }
 
-    # Sort types by count (most common first)
-    sorted_types = sorted(by_type.keys(), key=lambda t: len(by_type[t]), reverse=True)
+    # Sort types by count (most common first, ties in order of first appearance)
+    sorted_types = unique_types[np.lexsort((first_seen, -type_sizes))].tolist()
+
+    # Counts come from np.unique above; reused for the console and the stats box
+    type_counts = dict(zip(unique_types.tolist(), type_sizes.tolist()))
+    total = len(waypoints)
+    type0_count = type_counts.get(0, 0)
+    type1_count = type_counts.get(1, 0)
+    other_count = total - type0_count - type1_count
 
     print(f"Found {len(sorted_types)} unique types")
-    print(f"  Type 0: {len(by_type.get(0, []))} waypoints")
-    print(f"  Type 1: {len(by_type.get(1, []))} waypoints")
-    print(f"  Other types: {len(waypoints) - len(by_type.get(0, [])) - len(by_type.get(1, []))} waypoints")
+    print(f"  Type 0: {type0_count} waypoints")
+    print(f"  Type 1: {type1_count} waypoints")
+    print(f"  Other types: {other_count} waypoints")
 
     # Create figure
     fig, ax = plt.subplots(figsize=(16, 12))
@@ -70,16 +102,12 @@ def visualize_trackmap(waypoints, output_file='trackmap_visualization.png'):
     # Plot Type 0 (racing line) - thick blue line
     if 0 in by_type:
         type0_points = by_type[0]
-        x_coords = [p['x'] for p in type0_points]
-        z_coords = [p['z'] for p in type0_points]
-        ax.plot(x_coords, z_coords, 'b-', linewidth=3, label=f'Type 0 (Racing Line) - {len(type0_points)} pts', zorder=2)
+        ax.plot(xs[type0_points], zs[type0_points], 'b-', linewidth=3, label=f'Type 0 (Racing Line) - {len(type0_points)} pts', zorder=2, rasterized=True)
 
     # Plot Type 1 (track edge) - thick red line
     if 1 in by_type:
         type1_points = by_type[1]
-        x_coords = [p['x'] for p in type1_points]
-        z_coords = [p['z'] for p in type1_points]
-        ax.plot(x_coords, z_coords, 'r-', linewidth=3, label=f'Type 1 (Track Edge) - {len(type1_points)} pts', zorder=2)
+        ax.plot(xs[type1_points], zs[type1_points], 'r-', linewidth=3, label=f'Type 1 (Track Edge) - {len(type1_points)} pts', zorder=2, rasterized=True)
 
     # Plot other types as scatter points (markers)
     other_types = [t for t in sorted_types if t not in [0, 1]]
@@ -90,22 +118,16 @@ def visualize_trackmap(waypoints, output_file='trackmap_visualization.png'):
         # Plot first 6 types individually
         for i, type_val in enumerate(other_types[:6]):
             points = by_type[type_val]
-            x_coords = [p['x'] for p in points]
-            z_coords = [p['z'] for p in points]
             color = colors[i % len(colors)]
-            ax.scatter(x_coords, z_coords, c=color, s=50, alpha=0.7,
+            ax.scatter(xs[points], zs[points], c=color, s=50, alpha=0.7,
                       label=f'Type {type_val} - {len(points)} pts', zorder=3)
 
         # Plot remaining types as gray
         if len(other_types) > 6:
-            remaining_points = []
-            for type_val in other_types[6:]:
-                remaining_points.extend(by_type[type_val])
-
-            if remaining_points:
-                x_coords = [p['x'] for p in remaining_points]
-                z_coords = [p['z'] for p in remaining_points]
-                ax.scatter(x_coords, z_coords, c='gray', s=30, alpha=0.5,
+            remaining_points = np.concatenate([by_type[type_val] for type_val in other_types[6:]])
+
+            if len(remaining_points):
+                ax.scatter(xs[remaining_points], zs[remaining_points], c='gray', s=30, alpha=0.5,
                           label=f'Types {other_types[6]}-{other_types[-1]} - {len(remaining_points)} pts', zorder=1)
 
     # Add grid and labels
@@ -118,11 +140,6 @@ def visualize_trackmap(waypoints, output_file='trackmap_visualization.png'):
     ax.legend(loc='upper right', fontsize=10, framealpha=0.9)
 
     # Add statistics box
-    total = len(waypoints)
-    type0_count = len(by_type.get(0, []))
-    type1_count = len(by_type.get(1, []))
-    other_count = total - type0_count - type1_count
-
     stats_text = f"""Statistics:
 Total: {total} waypoints
 Type 0: {type0_count} ({type0_count/total*100:.1f}%)
@@ -140,30 +157,31 @@ Others: {other_count} ({other_count/total*100:.1f}%)"""
     print(f"  Image size: 150 DPI, ~{16*150}x{12*150} pixels")
 
     # Also create a zoomed view of a corner to show detail
-    create_detail_view(waypoints, by_type, 'trackmap_detail.png')
+    create_detail_view(xs, zs, by_type, 'trackmap_detail.png')
 
 
-def create_detail_view(waypoints, by_type, output_file='trackmap_detail.png'):
+def create_detail_view(xs, zs, by_type, output_file='trackmap_detail.png'):
     """
     Create a zoomed-in view of a section to show waypoint detail
 
     Args:
-        waypoints: List of all waypoints
-        by_type: Dict of waypoints grouped by type
+        xs: Array of waypoint X coordinates
+        zs: Array of waypoint Z coordinates
+        by_type: Dict of index arrays into xs/zs, grouped by type
         output_file: Output filename
     """
     print(f"\nCreating detail view...")
 
     # Find a section with good density (pick middle 10% of track)
-    all_x = [w['x'] for w in waypoints]
-    all_z = [w['z'] for w in waypoints]
+    x_lo, x_hi = xs.min().item(), xs.max().item()
+    z_lo, z_hi = zs.min().item(), zs.max().item()
 
-    x_range = max(all_x) - min(all_x)
-    z_range = max(all_z) - min(all_z)
+    x_range = x_hi - x_lo
+    z_range = z_hi - z_lo
 
     # Pick a 20% window in the middle
-    x_center = (max(all_x) + min(all_x)) / 2
-    z_center = (max(all_z) + min(all_z)) / 2
+    x_center = (x_hi + x_lo) / 2
+    z_center = (z_hi + z_lo) / 2
 
     x_min = x_center - x_range * 0.15
     x_max = x_center + x_range * 0.15
@@ -177,22 +195,22 @@ def create_detail_view(waypoints, by_type, output_file='trackmap_detail.png'):
     # Plot Type 0 (racing line)
     if 0 in by_type:
         type0_points = by_type[0]
-        x_coords = [p['x'] for p in type0_points]
-        z_coords = [p['z'] for p in type0_points]
-        ax.plot(x_coords, z_coords, 'b-', linewidth=4, label=f'Type 0 (Racing Line)', zorder=2, alpha=0.8)
+        x_coords = xs[type0_points]
+        z_coords = zs[type0_points]
+        ax.plot(x_coords, z_coords, 'b-', linewidth=4, label=f'Type 0 (Racing Line)', zorder=2, alpha=0.8, rasterized=True)
 
         # Mark individual waypoints
-        ax.scatter(x_coords, z_coords, c='blue', s=20, alpha=0.5, zorder=3)
+        ax.scatter(x_coords, z_coords, c='blue', s=20, alpha=0.5, zorder=3, rasterized=True)
 
     # Plot Type 1 (track edge)
     if 1 in by_type:
         type1_points = by_type[1]
-        x_coords = [p['x'] for p in type1_points]
-        z_coords = [p['z'] for p in type1_points]
-        ax.plot(x_coords, z_coords, 'r-', linewidth=4, label=f'Type 1 (Track Edge)', zorder=2, alpha=0.8)
+        x_coords = xs[type1_points]
+        z_coords = zs[type1_points]
+        ax.plot(x_coords, z_coords, 'r-', linewidth=4, label=f'Type 1 (Track Edge)', zorder=2, alpha=0.8, rasterized=True)
 
         # Mark individual waypoints
-        ax.scatter(x_coords, z_coords, c='red', s=20, alpha=0.5, zorder=3)
+        ax.scatter(x_coords, z_coords, c='red', s=20, alpha=0.5, zorder=3, rasterized=True)
 
     # Set zoom window
     ax.set_xlim(x_min, x_max)
@@ -230,11 +248,9 @@ def main():
         sys.exit(1)
 
     # Test connection
-    try:
-        req = Request(f"{BASE_URL}/rest/sessions")
-        with urlopen(req, timeout=1) as response:
-            print(f"✓ Connected to LMU REST API (status: {response.status})")
-    except Exception:
+    if api.is_available():
+        print("✓ Connected to LMU REST API")
+    else:
         print("✗ Cannot connect to LMU REST API at localhost:6397")
         print("  Make sure LMU is running and you're in a session!")
         sys.exit(1)